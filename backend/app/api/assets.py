@@ -2,22 +2,33 @@
 API endpoints for Phase 2: Asset Generation (Music and Images).
 """
 
+import logging
 import os
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
-from app.models.workflow import AudioAsset, ReferenceImage
+from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from app.models.workflow import AudioAsset
 from app.services.suno import generate_music
 from app.services.imagen import generate_reference_image
 from app.services.style_analyzer import analyze_style_from_images
-from app.services.supabase_storage import upload_image_to_storage, delete_image_from_storage
+from app.services.supabase_storage import (
+    upload_image_to_storage,
+    upload_image_bytes_to_storage,
+    delete_image_from_storage,
+)
 
 router = APIRouter(prefix="/api/assets", tags=["assets"])
 
+logger = logging.getLogger(__name__)
+
 
 class ReferenceImageRequest(BaseModel):
     """Request model for generating reference images."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     style_guide: str = Field(..., description="Visual style guide text")
     description: str = Field(..., description="Description of what to generate")
     shot_indices: List[int] = Field(..., description="List of shot indices this image applies to")
@@ -30,11 +41,19 @@ class ReferenceImageRequest(BaseModel):
 
 class StyleAnalysisRequest(BaseModel):
     """Request model for analyzing style from reference images/videos."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     images: List[str] = Field(..., description="List of base64-encoded image data URIs to analyze", min_length=1)
 
 
-@router.post("/generate-music", response_model=AudioAsset)
+# Cached validator for the reference-image request, used to validate the raw
+# request body in one pydantic-core pass instead of going through FastAPI's
+# dependency resolution (significant for bodies with many base64 images)
+_REFERENCE_IMAGE_REQUEST_ADAPTER = TypeAdapter(ReferenceImageRequest)
+
+
+@router.post("/generate-music")
 async def create_music(
     lyrics: str = Query(..., description="Lyrics text"),
     style: Optional[str] = Query(None, description="Music style"),
@@ -42,7 +61,7 @@ async def create_music(
     instrumental: bool = Query(False, description="Whether to generate instrumental music"),
     model: str = Query("V5", description="Model version"),
     custom_mode: bool = Query(True, description="Whether to use custom mode"),
-) -> AudioAsset:
+) -> ORJSONResponse:
     """
     Generate music using Kie.ai Suno API or fallback to manual generation.
     
@@ -86,16 +105,17 @@ async def create_music(
             if task_id:
                 # Return AudioAsset with task_id in file_url temporarily
                 # The callback will update this with the actual audio URL
-                return AudioAsset(
+                audio = AudioAsset(
                     audio_id=f"suno_task_{task_id}",
                     file_url=f"task://{task_id}",  # Special format to indicate it's a task
                     duration_seconds=0.0,
                     lyrics=lyrics,
                 )
-        
+                return ORJSONResponse(audio.model_dump(mode="json"))
+
         # Fallback to manual generation
         audio = await generate_music(lyrics, style)
-        return audio
+        return ORJSONResponse(audio.model_dump(mode="json"))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -149,13 +169,17 @@ async def get_music_task_status(task_id: str):
         }
 
 
-@router.post("/generate-reference-image", response_model=ReferenceImage)
-async def create_reference_image(request: ReferenceImageRequest) -> ReferenceImage:
+@router.post("/generate-reference-image")
+async def create_reference_image(raw_request: Request) -> ORJSONResponse:
     """
     Generate a reference image for visual consistency.
 
+    The JSON body (a ReferenceImageRequest) is validated straight from the
+    raw bytes with a cached TypeAdapter to keep parsing of the potentially
+    large base64 payloads in a single pydantic-core pass.
+
     Args:
-        request: Reference image generation request with style_guide, description, and shot_indices
+        raw_request: Incoming request whose body is a ReferenceImageRequest
 
     Returns:
         ReferenceImage: Generated reference image
@@ -163,13 +187,23 @@ async def create_reference_image(request: ReferenceImageRequest) -> ReferenceIma
     Raises:
         HTTPException: If generation fails
     """
-    # Log request details for debugging
-    print(f"🎨 Generate image request: description_length={len(request.description)}, "
-          f"style_guide_length={len(request.style_guide)}, "
-          f"shot_indices={request.shot_indices}, "
-          f"reference_images_count={len(request.reference_images_base64)}, "
-          f"previous_images_count={len(request.previous_images) if request.previous_images else 0}")
-    
+    try:
+        request = _REFERENCE_IMAGE_REQUEST_ADAPTER.validate_json(await raw_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    # Log request details for debugging (lazy %s formatting - only evaluated
+    # when DEBUG logging is enabled)
+    logger.debug(
+        "Generate image request: description_length=%d, style_guide_length=%d, "
+        "shot_indices=%s, reference_images_count=%d, previous_images_count=%d",
+        len(request.description),
+        len(request.style_guide),
+        request.shot_indices,
+        len(request.reference_images_base64),
+        len(request.previous_images) if request.previous_images else 0,
+    )
+
     try:
         # Support both old single image format and new multiple images format
         reference_images = request.reference_images_base64
@@ -180,7 +214,7 @@ async def create_reference_image(request: ReferenceImageRequest) -> ReferenceIma
         # Use image reference if any reference images are provided
         use_image_reference = request.use_image_reference or len(reference_images) > 0
         
-        print(f"🎨 Starting image generation (use_image_reference={use_image_reference})...")
+        logger.debug("Starting image generation (use_image_reference=%s)...", use_image_reference)
         image = await generate_reference_image(
             request.style_guide,
             request.description,
@@ -190,15 +224,15 @@ async def create_reference_image(request: ReferenceImageRequest) -> ReferenceIma
             use_image_reference,
             reference_images
         )
-        print(f"✅ Successfully generated image: {image.image_id}")
-        return image
+        logger.info("Successfully generated image: %s", image.image_id)
+        # Serialize the already-validated model directly, skipping FastAPI's
+        # response_model re-validation pass (costly for large base64 payloads)
+        return ORJSONResponse(image.model_dump(mode="json"))
     except ValueError as e:
         # Include the full error message for debugging
         error_msg = str(e)
-        import traceback
-        print(f"❌ ValueError in generate-reference-image: {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
-        
+        logger.exception("ValueError in generate-reference-image: %s", error_msg)
+
         # Provide more helpful error messages for common issues
         if "API key" in error_msg.lower() or "not set" in error_msg.lower():
             if "KIE_AI_API_KEY" in error_msg or "kie" in error_msg.lower():
@@ -222,14 +256,12 @@ async def create_reference_image(request: ReferenceImageRequest) -> ReferenceIma
     except Exception as e:
         # Include full error details for debugging
         error_msg = f"Image generation failed: {str(e)}"
-        import traceback
-        print(f"❌ Exception in generate-reference-image: {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Exception in generate-reference-image: %s", error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 
-@router.post("/analyze-style", response_model=Dict[str, Any])
-async def analyze_style_guide(request: StyleAnalysisRequest) -> Dict[str, Any]:
+@router.post("/analyze-style")
+async def analyze_style_guide(request: StyleAnalysisRequest) -> ORJSONResponse:
     """
     Analyze reference images/videos to extract comprehensive style guide information.
     
@@ -257,59 +289,50 @@ async def analyze_style_guide(request: StyleAnalysisRequest) -> Dict[str, Any]:
         HTTPException: If analysis fails
     """
     try:
-        print(f"Received analyze-style request with {len(request.images) if request.images else 0} image(s)")
-        
-        # Validate request
+        logger.debug("Received analyze-style request with %d image(s)",
+                     len(request.images) if request.images else 0)
+
+        # Validate request (min_length=1 on the model already enforces a
+        # non-empty list at parse time; this guards direct callers)
         if not request.images:
-            print("ERROR: No images in request")
-            raise HTTPException(
-                status_code=400, 
-                detail="No images provided. Please upload at least one image."
-            )
-        
-        if len(request.images) == 0:
-            print("ERROR: Images array is empty")
+            logger.warning("analyze-style request contained no images")
             raise HTTPException(
                 status_code=400,
-                detail="Images array is empty. Please upload at least one image."
+                detail="No images provided. Please upload at least one image."
             )
-        
-        # Check image format
-        first_image = request.images[0]
-        if not first_image:
-            print("ERROR: First image is None or empty")
+
+        if not request.images[0]:
+            logger.warning("analyze-style first image is None or empty")
             raise HTTPException(
                 status_code=400,
                 detail="Invalid image data: first image is empty."
             )
-        
-        print(f"First image length: {len(first_image)} characters")
-        print(f"First image starts with: {first_image[:50]}...")
-        
-        print(f"Analyzing {len(request.images)} image(s) for style extraction...")
-        
+
+        logger.debug("Analyzing %d image(s) for style extraction...", len(request.images))
+
         style_data = analyze_style_from_images(request.images)
-        print("Style analysis completed successfully")
-        return style_data
+        logger.info("Style analysis completed successfully")
+        # Serialize directly with orjson, skipping FastAPI's jsonable_encoder pass
+        return ORJSONResponse(style_data)
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except ValueError as e:
-        print(f"ValueError in style analysis: {e}")
+        logger.exception("ValueError in style analysis: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Style analysis error: {error_trace}")
+        logger.exception("Style analysis error")
         raise HTTPException(
-            status_code=500, 
+            status_code=500,
             detail=f"Style analysis failed: {str(e)}"
         )
 
 
 class ImageUploadRequest(BaseModel):
     """Request model for uploading images to Supabase Storage."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     image_data_base64: str = Field(..., description="Base64 encoded image data (data URI format)")
     image_id: str = Field(..., description="Unique identifier for the image")
     workflow_id: str = Field(..., description="Workflow/project identifier")
@@ -318,7 +341,9 @@ class ImageUploadRequest(BaseModel):
 
 class ImageDeleteRequest(BaseModel):
     """Request model for deleting images from Supabase Storage."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     storage_url: str = Field(..., description="Supabase Storage URL of the image")
 
 
@@ -405,6 +430,60 @@ async def upload_image_to_storage_endpoint(request: ImageUploadRequest) -> dict:
         raise HTTPException(status_code=status_code, detail=f"Supabase Storage upload failed: {error_msg}")
 
 
+@router.post("/upload-image-file")
+async def upload_image_file_to_storage_endpoint(
+    file: UploadFile = File(..., description="Image file to upload"),
+    image_id: str = Form(..., description="Unique identifier for the image"),
+    workflow_id: str = Form(..., description="Workflow/project identifier"),
+    description: str = Form("", description="Description of the image"),
+) -> dict:
+    """
+    Upload an image to Supabase Storage as raw multipart bytes.
+
+    Preferred over /upload-image for new clients: the image travels as
+    binary multipart data instead of a JSON-embedded base64 string, which
+    avoids the ~33% size inflation and the base64 encode/decode passes on
+    both sides.
+
+    Args:
+        file: Image file (multipart upload)
+        image_id: Unique identifier for the image
+        workflow_id: Workflow/project identifier
+        description: Description of the image
+
+    Returns:
+        dict: {"url": str} - Public URL of the uploaded image
+
+    Raises:
+        HTTPException: If upload fails
+    """
+    if not image_id.strip():
+        raise HTTPException(status_code=400, detail="image_id is required and cannot be empty")
+    if not workflow_id.strip():
+        raise HTTPException(status_code=400, detail="workflow_id is required and cannot be empty")
+
+    image_bytes = await file.read()
+    if not image_bytes:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+    content_type = file.content_type or "image/png"
+
+    try:
+        url = await upload_image_bytes_to_storage(
+            image_bytes,
+            content_type,
+            image_id,
+            workflow_id,
+            description
+        )
+        logger.info("Successfully uploaded image %s to storage: %s", image_id, url)
+        return {"url": url}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Supabase Storage upload failed: {str(e)}")
+
+
 @router.delete("/delete-image")
 async def delete_image_from_storage_endpoint(request: ImageDeleteRequest) -> dict:
     """
@@ -2,9 +2,19 @@
 API endpoints for image feedback and learning system.
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import hashlib
+import logging
+import time
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from supabase import Client
+from app.services.supabase_client import get_supabase
 from app.services.image_learning_service import (
     analyze_approved_image,
     get_learning_insights,
@@ -13,10 +23,55 @@ from app.services.image_learning_service import (
 
 router = APIRouter(prefix="/api/learning", tags=["learning"])
 
+logger = logging.getLogger(__name__)
+
+
+def _get_supabase() -> Client:
+    """
+    Return the shared Supabase client.
+
+    Raises:
+        HTTPException: If Supabase credentials are not configured
+    """
+    try:
+        return get_supabase()
+    except ValueError as e:
+        # Missing configuration is a server problem, not a bad request
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _favorited_images_response(favorited_images: List[Dict[str, Any]], format: str) -> Response:
+    """
+    Serialize the favorited-images payload, streaming NDJSON when requested.
+
+    NDJSON delivers one image per line as it is serialized, so streaming
+    clients can render results incrementally instead of waiting for the
+    whole array; the default stays a plain JSON array for existing clients.
+    """
+    if format == "ndjson":
+        async def _gen():
+            for item in favorited_images:
+                yield orjson.dumps(item) + b"\n"
+
+        return StreamingResponse(_gen(), media_type="application/x-ndjson")
+
+    return ORJSONResponse(favorited_images)
+
+
+def _is_missing_table(e: Exception) -> bool:
+    """True if the error means the queried table hasn't been created yet."""
+    # postgrest APIError carries the Postgres error code directly
+    if getattr(e, "code", None) == "42P01":  # undefined_table
+        return True
+    msg = str(e).lower()
+    return "does not exist" in msg or "relation" in msg
+
 
 class ImageFeedbackRequest(BaseModel):
     """Request model for submitting image feedback."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     image_id: str = Field(..., description="Image ID")
     workflow_id: str = Field(..., description="Workflow ID")
     approved: bool = Field(default=False, description="Whether image is approved")
@@ -30,33 +85,180 @@ class ImageFeedbackRequest(BaseModel):
     content_type: Optional[str] = Field(None, description="Content type")
 
 
+# Cached validator for feedback submissions, used to validate the raw request
+# body in one pydantic-core pass instead of FastAPI's dependency resolution
+_IMAGE_FEEDBACK_REQUEST_ADAPTER = TypeAdapter(ImageFeedbackRequest)
+
+# Short-lived cache for the read endpoints, keyed on their query args.
+# Favorites and aggregated insights change rarely, so brief staleness is
+# fine - and feedback writes clear the cache anyway, so the common case
+# (user favorites an image, gallery refreshes) stays consistent. Keys
+# embed caller-controlled values (limits, filters, prompt digests), so
+# the cache is bounded: expired entries are evicted when full, then the
+# oldest insertions if still needed.
+_READ_CACHE_TTL_SECONDS = 60.0
+_READ_CACHE_MAX_ENTRIES = 256
+_read_cache: Dict[Any, Any] = {}
+
+
+def _read_cache_get(key: Any) -> Optional[Any]:
+    """Return the cached value for key, or None if absent/expired."""
+    entry = _read_cache.get(key)
+    if entry is not None:
+        cached_at, value = entry
+        if time.monotonic() - cached_at < _READ_CACHE_TTL_SECONDS:
+            return value
+        del _read_cache[key]
+    return None
+
+
+def _read_cache_set(key: Any, value: Any) -> None:
+    """Store value under key, evicting old entries when the cache is full."""
+    now = time.monotonic()
+    if len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+        expired = [
+            k for k, (cached_at, _) in _read_cache.items()
+            if now - cached_at >= _READ_CACHE_TTL_SECONDS
+        ]
+        for k in expired:
+            del _read_cache[k]
+        # Dicts iterate in insertion order, so the front entries are the
+        # oldest writes - drop those if expiry alone didn't make room
+        while len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+            del _read_cache[next(iter(_read_cache))]
+    _read_cache[key] = (now, value)
+
+
+# Micro-batcher for feedback upserts: bursts of /feedback calls (e.g. a
+# user favoriting a whole gallery) that land within the flush window are
+# coalesced into one PostgREST upsert instead of one round trip per row.
+# Individual callers still see close to single-row latency.
+_FEEDBACK_FLUSH_WINDOW_SECONDS = 0.05
+_FEEDBACK_BATCH_MAX_ROWS = 100
+_feedback_batch: List[tuple] = []  # (row, future) pairs
+_feedback_flush_task: Optional[asyncio.Task] = None
+
+
+async def _flush_feedback_batch(supabase: Client) -> None:
+    """Upsert all pending feedback rows in one query and resolve their futures."""
+    global _feedback_flush_task
+    _feedback_flush_task = None
+
+    batch = list(_feedback_batch)
+    _feedback_batch.clear()
+    if not batch:
+        return
+
+    # Postgres rejects an upsert that touches the same conflict key twice
+    # ("ON CONFLICT DO UPDATE command cannot affect row a second time"), and
+    # double-clicks/client retries can land two rows for one image in the
+    # same flush window - keep only the last row per image_id
+    deduped: Dict[str, Dict[str, Any]] = {}
+    for row, _ in batch:
+        deduped[row["image_id"]] = row
+    rows = list(deduped.values())
+    try:
+        upsert_query = supabase.table("image_feedback").upsert(rows, on_conflict="image_id")
+        result = await asyncio.to_thread(upsert_query.execute)
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for _, future in batch:
+        if not future.done():
+            future.set_result(result)
+
+
+async def _delayed_feedback_flush(supabase: Client) -> None:
+    """Wait out the coalescing window, then flush whatever accumulated."""
+    await asyncio.sleep(_FEEDBACK_FLUSH_WINDOW_SECONDS)
+    await _flush_feedback_batch(supabase)
+
+
+async def _upsert_feedback_batched(supabase: Client, row: Dict[str, Any]) -> Any:
+    """
+    Enqueue a feedback row for the next batched upsert and await its result.
+
+    Flushes immediately once the batch is full, otherwise after the
+    coalescing window elapses.
+    """
+    global _feedback_flush_task
+
+    future = asyncio.get_running_loop().create_future()
+    _feedback_batch.append((row, future))
+
+    if len(_feedback_batch) >= _FEEDBACK_BATCH_MAX_ROWS:
+        if _feedback_flush_task is not None and not _feedback_flush_task.done():
+            _feedback_flush_task.cancel()
+        await _flush_feedback_batch(supabase)
+    elif _feedback_flush_task is None or _feedback_flush_task.done():
+        _feedback_flush_task = asyncio.create_task(_delayed_feedback_flush(supabase))
+
+    return await future
+
+
+# Strong references to in-flight background tasks so they aren't garbage
+# collected before completing
+_background_tasks: set = set()
+
+
+def _spawn_background_task(coro) -> None:
+    """Schedule a fire-and-forget coroutine, keeping a reference until done."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _analyze_and_update_feedback(supabase: Client, feedback: ImageFeedbackRequest) -> None:
+    """
+    Run image analysis in the background and attach the results to the
+    already-stored feedback row.
+    """
+    try:
+        analysis = await analyze_approved_image(
+            image=None,  # Would need actual image for vision analysis
+            style_guide=feedback.style_guide or "",
+            prompt_used=feedback.prompt_used or "",
+            channel_name=feedback.channel_name,
+            content_type=feedback.content_type
+        )
+
+        update_query = supabase.table("image_feedback").update({
+            "visual_characteristics": analysis.get("visual_characteristics", {}),
+            "success_factors": analysis.get("success_factors", {}),
+        }).eq("image_id", feedback.image_id)
+        await asyncio.to_thread(update_query.execute)
+    except Exception as e:
+        logger.exception("Background feedback analysis failed for %s: %s", feedback.image_id, e)
+
+
 class LearningInsightsRequest(BaseModel):
     """Request model for getting learning insights."""
-    
+
+    model_config = ConfigDict(frozen=True)
+
     channel_name: Optional[str] = Field(None, description="Filter by channel name")
     content_type: Optional[str] = Field(None, description="Filter by content type")
     limit: int = Field(default=10, ge=1, le=50, description="Maximum number of images to analyze")
 
 
 @router.post("/feedback")
-async def submit_image_feedback(feedback: ImageFeedbackRequest) -> Dict[str, Any]:
+async def submit_image_feedback(request: Request) -> ORJSONResponse:
     """
-    Submit feedback for a generated image.
-    
+    Submit feedback for a generated image (body: ImageFeedbackRequest).
+
     This stores the feedback and triggers analysis if the image is approved/favorited.
     """
     try:
-        import os
-        from supabase import create_client, Client
-        
-        supabase_url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-        
-        if not supabase_url or not supabase_key:
-            raise HTTPException(status_code=500, detail="Supabase not configured")
-        
-        supabase: Client = create_client(supabase_url, supabase_key)
-        
+        feedback = _IMAGE_FEEDBACK_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    try:
+        supabase = _get_supabase()
+
         # Prepare feedback data
         feedback_data = {
             "image_id": feedback.image_id,
@@ -72,32 +274,27 @@ async def submit_image_feedback(feedback: ImageFeedbackRequest) -> Dict[str, Any
             "content_type": feedback.content_type,
         }
         
-        # If approved or favorited, trigger analysis
-        if feedback.approved or feedback.favorited:
-            # Note: We'd need the actual image data for full analysis
-            # For now, we'll analyze based on description and prompt
-            analysis = await analyze_approved_image(
-                image=None,  # Would need actual image for vision analysis
-                style_guide=feedback.style_guide or "",
-                prompt_used=feedback.prompt_used or "",
-                channel_name=feedback.channel_name,
-                content_type=feedback.content_type
-            )
-            
-            feedback_data["visual_characteristics"] = analysis.get("visual_characteristics", {})
-            feedback_data["success_factors"] = analysis.get("success_factors", {})
-        
-        # Upsert feedback
-        result = supabase.table("image_feedback").upsert(
-            feedback_data,
-            on_conflict="image_id"
-        ).execute()
-        
-        return {
+        # Upsert the base feedback row via the micro-batcher (coalesces
+        # concurrent submissions into one query; the synchronous client
+        # call runs off the event loop)
+        await _upsert_feedback_batched(supabase, feedback_data)
+
+        # If approved or favorited, enrich the row with analysis results in
+        # the background - the slow model call no longer blocks the response
+        # Note: We'd need the actual image data for full analysis
+        # For now, we analyze based on description and prompt
+        analyzed = feedback.approved or feedback.favorited
+        if analyzed:
+            _spawn_background_task(_analyze_and_update_feedback(supabase, feedback))
+
+        # Drop cached reads so new favorites show up immediately
+        _read_cache.clear()
+
+        return ORJSONResponse({
             "success": True,
             "message": "Feedback saved successfully",
-            "analyzed": feedback.approved or feedback.favorited
-        }
+            "analyzed": analyzed
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save feedback: {str(e)}")
@@ -105,100 +302,142 @@ async def submit_image_feedback(feedback: ImageFeedbackRequest) -> Dict[str, Any
 
 @router.get("/favorited-images")
 async def get_favorited_images(
-    limit: int = 50
-) -> List[Dict[str, Any]]:
+    limit: int = 50,
+    include_inline: bool = False,
+    format: str = "json"
+) -> Response:
     """
     Get favorited images with their image data from workflows.
-    
-    Returns favorited images that can be used as references.
+
+    Returns favorited images that can be used as references. Responses
+    carry storage URLs only; pass include_inline=true to also get the
+    base64 image data (can add hundreds of KB per image). Pass
+    format=ndjson to stream one image per line instead of a JSON array.
     """
+    cache_key = ("favorited-images", limit, include_inline)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return _favorited_images_response(cached, format)
+
     try:
-        import os
-        import traceback
-        from supabase import create_client, Client
-        
-        print(f"📚 Getting favorited images (limit={limit})...")
-        
-        supabase_url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-        
-        if not supabase_url or not supabase_key:
-            error_msg = "Supabase not configured. Please set SUPABASE_URL (or NEXT_PUBLIC_SUPABASE_URL) and SUPABASE_ANON_KEY (or NEXT_PUBLIC_SUPABASE_ANON_KEY)"
-            print(f"❌ {error_msg}")
-            raise HTTPException(status_code=500, detail=error_msg)
-        
-        print(f"✅ Supabase configured: URL={supabase_url[:30]}...")
-        supabase: Client = create_client(supabase_url, supabase_key)
-        
+        logger.debug("Getting favorited images (limit=%s)...", limit)
+
+        supabase = _get_supabase()
+
+        # Preferred path: one server-side query via RPC that extracts only the
+        # matching reference_images entry per favorite, instead of shipping
+        # whole reference_images arrays over the wire (see
+        # supabase_migrations/create_get_favorited_reference_images_function.sql)
+        try:
+            rpc_query = supabase.rpc("get_favorited_reference_images", {"p_limit": limit})
+            rpc_response = await asyncio.to_thread(rpc_query.execute)
+            if rpc_response.data is not None:
+                favorited_images = [
+                    {
+                        "image_id": row["image_id"],
+                        # Only ship base64 when asked for, or when there is no
+                        # storage URL to display instead
+                        "base64_data": (row.get("base64_data") or "")
+                        if include_inline or not row.get("storage_url") else "",
+                        "storage_url": row.get("storage_url"),
+                        "description": row.get("description", ""),
+                        "visual_characteristics": row.get("visual_characteristics"),
+                    }
+                    for row in rpc_response.data
+                ]
+                logger.info("Returning %d favorited image(s) via RPC", len(favorited_images))
+                _read_cache_set(cache_key, favorited_images)
+                return _favorited_images_response(favorited_images, format)
+        except Exception as e:
+            # Function not deployed yet - fall back to the two-query path
+            logger.warning("get_favorited_reference_images RPC unavailable, falling back: %s", e)
+
         # Get favorited image feedback
-        print("📚 Querying image_feedback table...")
+        logger.debug("Querying image_feedback table...")
         try:
-            response = supabase.table("image_feedback").select(
+            feedback_query = supabase.table("image_feedback").select(
                 "image_id, workflow_id, description, visual_characteristics"
-            ).eq("favorited", True).order("created_at", desc=True).limit(limit).execute()
+            ).eq("favorited", True).order("created_at", desc=True).limit(limit)
+            response = await asyncio.to_thread(feedback_query.execute)
             
             if not response.data:
-                print("📚 No favorited images found")
-                return []
+                logger.info("No favorited images found")
+                return _favorited_images_response([], format)
             
             feedback_data = response.data if hasattr(response, 'data') else []
-            print(f"📚 Found {len(feedback_data)} favorited image(s)")
+            logger.debug("Found %d favorited image(s)", len(feedback_data))
         except Exception as e:
-            error_msg = f"Failed to query image_feedback table: {str(e)}"
-            print(f"❌ {error_msg}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Failed to query image_feedback table: %s", e)
             # If table doesn't exist, return empty list instead of error
-            if "does not exist" in str(e).lower() or "relation" in str(e).lower():
-                print("⚠️ image_feedback table may not exist - returning empty list")
-                return []
+            if _is_missing_table(e):
+                logger.warning("image_feedback table may not exist - returning empty list")
+                return _favorited_images_response([], format)
             raise
         
+        # Fetch all referenced workflows in a single query instead of one
+        # round-trip per feedback row (classic N+1)
+        workflow_ids = list({
+            feedback["workflow_id"]
+            for feedback in feedback_data
+            if feedback.get("workflow_id")
+        })
+
+        # Index each workflow's reference images by image_id so the loop
+        # below is a pair of O(1) dict lookups instead of a linear scan
+        # per feedback row
+        images_by_workflow = {}
+        if workflow_ids:
+            try:
+                workflow_query = supabase.table("video_workflows").select(
+                    "workflow_id, reference_images"
+                ).in_("workflow_id", workflow_ids)
+                workflow_response = await asyncio.to_thread(workflow_query.execute)
+
+                images_by_workflow = {
+                    workflow["workflow_id"]: {
+                        img["image_id"]: img
+                        for img in (workflow.get("reference_images") or [])
+                        if img.get("image_id")
+                    }
+                    for workflow in (workflow_response.data or [])
+                }
+            except Exception as e:
+                logger.warning("Error getting workflows %s: %s", workflow_ids, e)
+
         # Get actual image data from workflows
         favorited_images = []
         for feedback in feedback_data:
             workflow_id = feedback.get("workflow_id")
             image_id = feedback.get("image_id")
-            
+
             if not workflow_id or not image_id:
                 continue
-            
-            # Get workflow
-            try:
-                workflow_response = supabase.table("video_workflows").select(
-                    "reference_images"
-                ).eq("workflow_id", workflow_id).execute()
-                
-                if not workflow_response.data:
-                    continue
-                
-                workflow = workflow_response.data[0]
-                
-                # Find the image in the workflow
-                reference_images = workflow.get("reference_images", [])
-                image = next((img for img in reference_images if img.get("image_id") == image_id), None)
-                
-                if image:
-                    favorited_images.append({
-                        "image_id": image_id,
-                        "base64_data": image.get("base64_data") or "",
-                        "storage_url": image.get("storage_url"),
-                        "description": feedback.get("description", ""),
-                        "visual_characteristics": feedback.get("visual_characteristics"),
-                    })
-            except Exception as e:
-                print(f"⚠️ Error getting workflow {workflow_id}: {str(e)}")
-                continue
+
+            # Find the image in the workflow
+            image = images_by_workflow.get(workflow_id, {}).get(image_id)
+
+            if image:
+                favorited_images.append({
+                    "image_id": image_id,
+                    # Only ship base64 when asked for, or when there is no
+                    # storage URL to display instead
+                    "base64_data": (image.get("base64_data") or "")
+                    if include_inline or not image.get("storage_url") else "",
+                    "storage_url": image.get("storage_url"),
+                    "description": feedback.get("description", ""),
+                    "visual_characteristics": feedback.get("visual_characteristics"),
+                })
         
-        print(f"✅ Returning {len(favorited_images)} favorited image(s)")
-        return favorited_images
+        logger.info("Returning %d favorited image(s)", len(favorited_images))
+        _read_cache_set(cache_key, favorited_images)
+        # Serialize directly with orjson - these payloads can carry large base64 data
+        return _favorited_images_response(favorited_images, format)
         
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = f"Failed to get favorited images: {str(e)}"
-        print(f"❌ {error_msg}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 
@@ -207,21 +446,26 @@ async def get_insights(
     channel_name: Optional[str] = None,
     content_type: Optional[str] = None,
     limit: int = 10
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Get learning insights from approved/favorited images.
-    
+
     Returns patterns and recommendations based on user feedback.
     """
-    try:
-        insights = await get_learning_insights(
-            channel_name=channel_name,
-            content_type=content_type,
-            limit=limit
-        )
-        return insights
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get insights: {str(e)}")
+    cache_key = ("insights", channel_name, content_type, limit)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # Errors propagate to the app-level handlers (ValueError -> 400,
+    # anything else -> 500)
+    insights = await get_learning_insights(
+        channel_name=channel_name,
+        content_type=content_type,
+        limit=limit
+    )
+    _read_cache_set(cache_key, insights)
+    return ORJSONResponse(insights)
 
 
 @router.post("/enhance-prompt")
@@ -230,7 +474,7 @@ async def enhance_prompt(
     style_guide: str,
     channel_name: Optional[str] = None,
     content_type: Optional[str] = None
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """
     Enhance a prompt with learned patterns from approved images.
     
@@ -243,25 +487,36 @@ async def enhance_prompt(
     Returns:
         Enhanced prompt with learning insights
     """
-    try:
-        # Get learning insights
-        insights = await get_learning_insights(
-            channel_name=channel_name,
-            content_type=content_type,
-            limit=10
-        )
-        
-        # Enhance prompt
-        enhanced = enhance_prompt_with_learning(
-            base_prompt=base_prompt,
-            style_guide=style_guide,
-            learning_insights=insights
-        )
-        
-        return {
-            "original_prompt": base_prompt,
-            "enhanced_prompt": enhanced,
-            "insights_used": insights
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to enhance prompt: {str(e)}")
+    # Identical (prompt, style, filter) tuples are common as the UI
+    # re-renders; hash them and serve repeats from the read cache, which
+    # feedback writes already invalidate so enhancements track new approvals
+    digest = hashlib.blake2b(
+        "\x00".join((base_prompt, style_guide, channel_name or "", content_type or "")).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cache_key = ("enhance-prompt", digest)
+    cached = _read_cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # Get learning insights; errors propagate to the app-level handlers
+    insights = await get_learning_insights(
+        channel_name=channel_name,
+        content_type=content_type,
+        limit=10
+    )
+
+    # Enhance prompt
+    enhanced = enhance_prompt_with_learning(
+        base_prompt=base_prompt,
+        style_guide=style_guide,
+        learning_insights=insights
+    )
+
+    response_data = {
+        "original_prompt": base_prompt,
+        "enhanced_prompt": enhanced,
+        "insights_used": insights
+    }
+    _read_cache_set(cache_key, response_data)
+    return ORJSONResponse(response_data)
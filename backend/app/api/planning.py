@@ -26,8 +26,9 @@ async def create_storyboard(request: StoryboardGenerationRequest) -> Storyboard:
     try:
         storyboard = generate_storyboard(request)
         return storyboard
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError:
+        # Mapped to a 400 by the app-level ValueError handler
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Storyboard generation failed: {str(e)}")
 
@@ -2,19 +2,39 @@
 API endpoints for webhook callbacks from external services.
 """
 
-from fastapi import APIRouter, Request, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Request, Response, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from typing import Optional, Dict, Any
-import json
+import asyncio
 import logging
+import time
+
+import orjson
 
 from app.services.imagen import handle_kie_callback
 from app.services.suno import convert_suno_result_to_audio_asset
+from app.services.supabase_client import get_supabase
 
-router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
+# Explicit ORJSONResponse so callback acks serialize through orjson even if
+# the app-level default ever changes
+router = APIRouter(
+    prefix="/api/webhooks",
+    tags=["webhooks"],
+    default_response_class=ORJSONResponse,
+)
 
 logger = logging.getLogger(__name__)
 
+# Static verification-GET bodies, encoded once at import time so the routes
+# don't re-serialize the same dict on every request
+_KIE_VERIFICATION_BODY = orjson.dumps(
+    {"status": "ok", "message": "Kie.ai webhook endpoint is active"}
+)
+_SUNO_VERIFICATION_BODY = orjson.dumps(
+    {"status": "ok", "message": "Suno webhook endpoint is active"}
+)
+
 
 class KieCallbackPayload(BaseModel):
     """
@@ -27,116 +47,167 @@ class KieCallbackPayload(BaseModel):
     - failMsg: Error message if task failed
     - failCode: Error code if task failed
     """
-    taskId: Optional[str] = None
-    task_id: Optional[str] = None  # Support snake_case variant
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    # One canonical attribute per concept; AliasChoices accepts either the
+    # camelCase or snake_case spelling on input
+    task_id: Optional[str] = Field(None, validation_alias=AliasChoices("taskId", "task_id"))
     state: Optional[str] = None
-    resultJson: Optional[str] = None
-    result_json: Optional[str] = None  # Support snake_case variant
-    failMsg: Optional[str] = None
-    fail_msg: Optional[str] = None  # Support snake_case variant
-    failCode: Optional[str] = None
-    fail_code: Optional[str] = None  # Support snake_case variant
+    result_json: Optional[str] = Field(None, validation_alias=AliasChoices("resultJson", "result_json"))
+    fail_msg: Optional[str] = Field(None, validation_alias=AliasChoices("failMsg", "fail_msg"))
+    fail_code: Optional[str] = Field(None, validation_alias=AliasChoices("failCode", "fail_code"))
     code: Optional[int] = None  # API response code
     msg: Optional[str] = None  # API response message
     data: Optional[Dict[str, Any]] = None  # Nested data structure
 
 
+# Cached validator - one pydantic-core pass per callback
+_KIE_CALLBACK_ADAPTER = TypeAdapter(KieCallbackPayload)
+
+# Webhook providers retry on timeout/non-2xx, so the same task can be
+# delivered more than once. Remember recently accepted task ids and
+# short-circuit duplicates instead of re-running the processing path.
+_SEEN_TASKS_TTL_SECONDS = 3600.0
+_SEEN_TASKS_MAX_ENTRIES = 10_000
+_seen_tasks: Dict[str, float] = {}
+
+
+def _already_seen(task_id: str) -> bool:
+    """Return True if this task id was accepted within the TTL window."""
+    seen_at = _seen_tasks.get(task_id)
+    return seen_at is not None and time.monotonic() - seen_at < _SEEN_TASKS_TTL_SECONDS
+
+
+def _mark_seen(task_id: str) -> None:
+    """Record the task id, evicting old entries when the cache is full."""
+    now = time.monotonic()
+    if len(_seen_tasks) >= _SEEN_TASKS_MAX_ENTRIES:
+        expired = [
+            tid for tid, seen_at in _seen_tasks.items()
+            if now - seen_at >= _SEEN_TASKS_TTL_SECONDS
+        ]
+        for tid in expired:
+            del _seen_tasks[tid]
+        # Dicts iterate in insertion order, so the front entries are the
+        # oldest marks - drop those if expiry alone didn't make room
+        while len(_seen_tasks) >= _SEEN_TASKS_MAX_ENTRIES:
+            del _seen_tasks[next(iter(_seen_tasks))]
+    _seen_tasks[task_id] = now
+
+
+async def _run_marked(dedupe_key: str, func, *args, **kwargs) -> None:
+    """
+    Run a callback processor as a background task, dropping its dedupe
+    entry if it raises - the provider's retried delivery then re-processes
+    instead of being answered as a duplicate for the full TTL.
+    """
+    try:
+        await func(*args, **kwargs)
+    except Exception as e:
+        _seen_tasks.pop(dedupe_key, None)
+        logger.error(
+            "Callback processing failed for %s (provider retry will re-process): %s",
+            dedupe_key, e, exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+
+
 @router.post("/kie-callback")
-async def kie_callback(request: Request, payload: Optional[KieCallbackPayload] = None):
+async def kie_callback(request: Request, background_tasks: BackgroundTasks):
     """
     Webhook endpoint to receive task completion callbacks from Kie.ai API.
-    
+
     This endpoint receives POST requests from Kie.ai when image generation tasks complete.
     The callback includes task status and result URLs for generated images.
-    
+
     Args:
-        request: FastAPI request object
-        payload: Callback payload from Kie.ai (auto-parsed from JSON body)
-    
+        request: FastAPI request object (body is a KieCallbackPayload, possibly
+            wrapped in a 'data' envelope)
+
     Returns:
         dict: Acknowledgment response
-    
+
     Note:
         Kie.ai will POST to this URL when a generation task completes.
         The callback payload structure matches the Get Task Details API response.
     """
+    # Read and decode the body exactly once (orjson is much faster than
+    # stdlib json and the old fallback re-parsed the same body twice)
     try:
-        # Try to parse JSON body if payload wasn't auto-parsed
-        if payload is None:
-            try:
-                body = await request.json()
-                payload = KieCallbackPayload(**body)
-            except Exception as e:
-                logger.error(f"Failed to parse callback payload: {e}")
-                # Try to parse as nested structure (some APIs wrap in 'data')
-                try:
-                    body = await request.json()
-                    if "data" in body:
-                        payload = KieCallbackPayload(**body["data"])
-                    else:
-                        raise HTTPException(status_code=400, detail="Invalid callback payload format")
-                except:
-                    raise HTTPException(status_code=400, detail=f"Invalid callback payload: {str(e)}")
-        
-        # Normalize field names (support both camelCase and snake_case)
-        task_id = payload.taskId or payload.task_id
-        state = payload.state
-        result_json_str = payload.resultJson or payload.result_json
-        fail_msg = payload.failMsg or payload.fail_msg
-        fail_code = payload.failCode or payload.fail_code
-        
-        # Handle nested data structure (some APIs wrap in 'data')
-        if payload.data:
-            task_id = task_id or payload.data.get("taskId") or payload.data.get("task_id")
-            state = state or payload.data.get("state")
-            result_json_str = result_json_str or payload.data.get("resultJson") or payload.data.get("result_json")
-            fail_msg = fail_msg or payload.data.get("failMsg") or payload.data.get("fail_msg")
-            fail_code = fail_code or payload.data.get("failCode") or payload.data.get("fail_code")
-        
-        if not task_id:
-            logger.warning("Callback received without taskId")
-            return {"status": "error", "message": "Missing taskId in callback"}
-        
-        logger.info(f"Received Kie.ai callback for task {task_id}, state: {state}")
-        
-        # Process the callback
-        await handle_kie_callback(
-            task_id=task_id,
-            state=state,
-            result_json_str=result_json_str,
-            fail_msg=fail_msg,
-            fail_code=fail_code
-        )
-        
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse callback body as JSON: %s", e)
+        raise HTTPException(status_code=400, detail=f"Invalid callback payload: {str(e)}")
+
+    # Some Kie.ai callbacks wrap everything in a 'data' envelope. Descend
+    # into it up-front so the payload is parsed and validated exactly once.
+    if (
+        isinstance(body, dict)
+        and isinstance(body.get("data"), dict)
+        and not any(k in body for k in ("taskId", "task_id", "state"))
+    ):
+        body = body["data"]
+
+    try:
+        payload = _KIE_CALLBACK_ADAPTER.validate_python(body)
+    except ValidationError as e:
+        logger.error("Failed to parse callback payload: %s", e)
+        raise HTTPException(status_code=400, detail=f"Invalid callback payload: {str(e)}")
+
+    task_id = payload.task_id
+    state = payload.state
+    result_json_str = payload.result_json
+    fail_msg = payload.fail_msg
+    fail_code = payload.fail_code
+
+    if not task_id:
+        logger.warning("Callback received without taskId")
+        return {"status": "error", "message": "Missing taskId in callback"}
+    
+    # Drop duplicate deliveries (provider retries) without re-running
+    # the download/DB path
+    if _already_seen(task_id):
+        logger.info("Duplicate Kie.ai callback for task %s - already processed", task_id)
         return {
             "status": "success",
-            "message": "Callback processed",
+            "message": "Duplicate callback ignored",
             "taskId": task_id
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error processing Kie.ai callback: {e}", exc_info=True)
-        # Still return 200 to acknowledge receipt (don't want Kie.ai to retry)
-        return {
-            "status": "error",
-            "message": f"Error processing callback: {str(e)}"
-        }
+    _mark_seen(task_id)
+
+    logger.info("Received Kie.ai callback for task %s, state: %s", task_id, state)
+
+    # Ack immediately and process after the response is sent, so Kie.ai
+    # isn't kept waiting on the image download/DB writes (and doesn't
+    # retry on timeout); a processing failure unmarks the task so the
+    # provider's retry isn't dropped as a duplicate
+    background_tasks.add_task(
+        _run_marked,
+        task_id,
+        handle_kie_callback,
+        task_id=task_id,
+        state=state,
+        result_json_str=result_json_str,
+        fail_msg=fail_msg,
+        fail_code=fail_code
+    )
+
+    return {
+        "status": "success",
+        "message": "Callback accepted",
+        "taskId": task_id
+    }
+
 
 
 @router.get("/kie-callback")
 async def kie_callback_get():
     """
     GET endpoint for webhook verification (some services use GET for verification).
-    
+
     Returns:
-        dict: Verification response
+        Response: Verification response (pre-encoded JSON)
     """
-    return {
-        "status": "ok",
-        "message": "Kie.ai webhook endpoint is active"
-    }
+    return Response(content=_KIE_VERIFICATION_BODY, media_type="application/json")
 
 
 class SunoCallbackPayload(BaseModel):
@@ -153,206 +224,224 @@ class SunoCallbackPayload(BaseModel):
     data: Optional[Dict[str, Any]] = None
 
 
+async def _process_suno_complete(task_id: Optional[str], first_track: Dict[str, Any]) -> None:
+    """
+    Update the matching workflow(s) with the generated audio.
+
+    Runs as a background task (via _run_marked) after the callback has
+    been acknowledged; failures are logged there and unmark the task so
+    the provider's retry re-processes it.
+    """
+    # Shared process-wide client (app.services.supabase_client) -
+    # reuses the pooled HTTP connections instead of rebuilding the
+    # client and TLS session on every callback
+    try:
+        supabase = get_supabase()
+    except ValueError:
+        logger.error("Supabase not configured - cannot update workflow")
+        return
+
+    audio_id = first_track.get("id")
+    audio_url = first_track.get("audio_url")
+    stream_audio_url = first_track.get("stream_audio_url")
+    duration = first_track.get("duration", 0.0)
+    prompt = first_track.get("prompt", "")
+
+    if not task_id:
+        logger.warning("Suno completion callback without task_id - nothing to update")
+        return
+
+    # Find workflow(s) with this task_id in audio_asset.file_url
+    # The file_url format is "task://{task_id}"
+    task_url = "task://" + task_id
+
+    logger.info("Searching for workflows with audio_asset.file_url = %s", task_url)
+
+    # Filter on audio_asset->>'file_url' server-side (PostgREST JSON
+    # path operator, backed by the functional index in
+    # supabase_migrations/add_workflow_audio_task_index.sql) instead
+    # of pulling the whole table and scanning it in Python. Only the
+    # two columns the update below reads are selected.
+    # supabase-py is synchronous - run the round trip off the event
+    # loop so other callbacks aren't serialized behind it
+    query = supabase.table("video_workflows").select(
+        "workflow_id, audio_asset"
+    ).eq("audio_asset->>file_url", task_url)
+    response = await asyncio.to_thread(query.execute)
+
+    matching_workflows = response.data or []
+
+    if not matching_workflows:
+        # Workflow may have been deleted or task_id doesn't match
+        logger.warning("No workflow found with task_id %s", task_id)
+        return
+
+    # Precompute one row per workflow (the lyrics fallback depends on
+    # the existing audio_asset), then write them all in a single upsert
+    # round trip instead of one update per workflow
+    rows = [
+        {
+            "workflow_id": workflow.get("workflow_id"),
+            "audio_asset": {
+                "audio_id": audio_id or f"suno_{task_id}",
+                "file_url": audio_url or stream_audio_url or "",
+                "duration_seconds": float(duration),
+                "lyrics": prompt or (workflow.get("audio_asset") or {}).get("lyrics", ""),
+            },
+        }
+        for workflow in matching_workflows
+    ]
+
+    upsert = supabase.table("video_workflows").upsert(rows, on_conflict="workflow_id")
+    upsert_response = await asyncio.to_thread(upsert.execute)
+
+    updated_count = len(upsert_response.data or [])
+    if updated_count < len(rows):
+        logger.warning(
+            "Upsert updated %d of %d matching workflow(s)", updated_count, len(rows)
+        )
+
+    logger.info("Updated %d workflow(s) with generated audio", updated_count)
+
+
+
 @router.post("/suno-callback")
-async def suno_callback(request: Request, payload: Optional[SunoCallbackPayload] = None):
+async def suno_callback(request: Request, background_tasks: BackgroundTasks):
     """
     Webhook endpoint to receive music generation callbacks from Kie.ai Suno API.
-    
+
     This endpoint receives POST requests from Kie.ai when music generation tasks complete.
     The callback includes task status and result URLs for generated audio.
-    
+
     Args:
-        request: FastAPI request object
-        payload: Callback payload from Kie.ai Suno API (auto-parsed from JSON body)
-    
+        request: FastAPI request object (body is a SunoCallbackPayload)
+
     Returns:
         dict: Acknowledgment response
-    
+
     Note:
         Kie.ai will POST to this URL when a music generation task completes.
         Callback types: "text" (text generation), "first" (first track), "complete" (all tracks)
     """
+    # Read and decode the body once with orjson, same as kie_callback
     try:
-        # Try to parse JSON body if payload wasn't auto-parsed
-        if payload is None:
-            try:
-                body = await request.json()
-                payload = SunoCallbackPayload(**body)
-            except Exception as e:
-                logger.error(f"Failed to parse Suno callback payload: {e}")
-                raise HTTPException(status_code=400, detail=f"Invalid callback payload: {str(e)}")
-        
-        logger.info(f"Received Suno callback: code={payload.code}, msg={payload.msg}")
-        
-        if payload.code != 200:
-            logger.warning(f"Suno callback indicates error: {payload.msg} (code: {payload.code})")
-            return {
-                "status": "error",
-                "message": payload.msg or "Generation failed",
-                "code": payload.code
-            }
-        
-        if not payload.data:
-            logger.warning("Suno callback missing data")
-            return {
-                "status": "error",
-                "message": "Missing data in callback"
-            }
-        
-        callback_type = payload.data.get("callbackType", "complete")
-        task_id = payload.data.get("task_id")
-        tracks_data = payload.data.get("data", [])
-        
-        logger.info(f"Suno callback: type={callback_type}, task_id={task_id}, tracks={len(tracks_data)}")
-        
-        # Only process "complete" callbacks (all tracks ready)
-        # "text" and "first" callbacks are intermediate stages
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse Suno callback payload: %s", e)
+        raise HTTPException(status_code=400, detail=f"Invalid callback payload: {str(e)}")
+
+    if not isinstance(body, dict):
+        logger.error("Suno callback body is not a JSON object")
+        raise HTTPException(status_code=400, detail="Invalid callback payload: expected a JSON object")
+
+    # The three top-level fields need no coercion, so read the parsed
+    # dict directly rather than paying for a model instantiation
+    # (SunoCallbackPayload above stays as the shape documentation)
+    code = body.get("code")
+    msg = body.get("msg")
+    data = body.get("data")
+
+    # Two of every three Suno callbacks are intermediate ("text",
+    # "first"); acknowledge those before any further work
+    if isinstance(data, dict):
+        callback_type = data.get("callbackType", "complete")
         if callback_type != "complete":
-            logger.info(f"Skipping intermediate callback type: {callback_type}")
+            logger.info("Skipping intermediate callback type: %s", callback_type)
             return {
                 "status": "success",
                 "message": f"Intermediate callback received ({callback_type})",
                 "callbackType": callback_type,
-                "task_id": task_id,
-            }
-        
-        if not tracks_data or len(tracks_data) == 0:
-            logger.warning("Suno callback has no tracks data")
-            return {
-                "status": "error",
-                "message": "No tracks in callback data"
+                "task_id": data.get("task_id"),
             }
-        
-        # Use the first track (or best track) for the workflow
-        # Usually 2 variations are generated, we'll use the first one
-        first_track = tracks_data[0]
-        audio_id = first_track.get("id")
-        audio_url = first_track.get("audio_url")
-        stream_audio_url = first_track.get("stream_audio_url")
-        duration = first_track.get("duration", 0.0)
-        prompt = first_track.get("prompt", "")
-        title = first_track.get("title", "")
-        
-        logger.info(f"Generated track: {title} ({audio_id}) - {audio_url}")
-        
-        # Update workflow with the generated audio
-        try:
-            import os
-            try:
-                from supabase import create_client, Client
-            except ImportError as e:
-                logger.error(f"Supabase package not installed: {e}")
-                return {
-                    "status": "error",
-                    "message": "Supabase package not installed"
-                }
-            
-            supabase_url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-            
-            if not supabase_url or not supabase_key:
-                logger.error("Supabase not configured - cannot update workflow")
-                return {
-                    "status": "error",
-                    "message": "Supabase not configured"
-                }
-            
-            supabase: Client = create_client(supabase_url, supabase_key)
-            
-            # Find workflow(s) with this task_id in audio_asset.file_url
-            # The file_url format is "task://{task_id}"
-            task_url = f"task://{task_id}"
-            
-            logger.info(f"Searching for workflows with audio_asset.file_url = {task_url}")
-            
-            # Query workflows where audio_asset->>'file_url' matches our task URL
-            response = supabase.table("video_workflows").select("*").execute()
-            
-            matching_workflows = []
-            for workflow in response.data:
-                audio_asset = workflow.get("audio_asset")
-                if audio_asset and isinstance(audio_asset, dict):
-                    file_url = audio_asset.get("file_url", "")
-                    if file_url == task_url:
-                        matching_workflows.append(workflow)
-            
-            if not matching_workflows:
-                logger.warning(f"No workflow found with task_id {task_id}")
-                # Still return success - callback was received correctly
-                return {
-                    "status": "success",
-                    "message": "Callback processed but no matching workflow found",
-                    "task_id": task_id,
-                    "note": "Workflow may have been deleted or task_id doesn't match"
-                }
-            
-            # Update all matching workflows (should usually be just one)
-            updated_count = 0
-            for workflow in matching_workflows:
-                workflow_id = workflow.get("workflow_id")
-                logger.info(f"Updating workflow {workflow_id} with generated audio")
-                
-                # Create updated audio_asset
-                updated_audio_asset = {
-                    "audio_id": audio_id or f"suno_{task_id}",
-                    "file_url": audio_url or stream_audio_url or "",
-                    "duration_seconds": float(duration),
-                    "lyrics": prompt or workflow.get("audio_asset", {}).get("lyrics", ""),
-                }
-                
-                # Update the workflow
-                update_response = supabase.table("video_workflows").update({
-                    "audio_asset": updated_audio_asset
-                }).eq("workflow_id", workflow_id).execute()
-                
-                if update_response.data:
-                    updated_count += 1
-                    logger.info(f"Successfully updated workflow {workflow_id}")
-                else:
-                    logger.warning(f"Failed to update workflow {workflow_id}")
-            
-            logger.info(f"Updated {updated_count} workflow(s) with generated audio")
-            
+
+    logger.info("Received Suno callback: code=%s, msg=%s", code, msg)
+
+    if code != 200:
+        logger.warning("Suno callback indicates error: %s (code: %s)", msg, code)
+        return {
+            "status": "error",
+            "message": msg or "Generation failed",
+            "code": code
+        }
+
+    if not data or not isinstance(data, dict):
+        logger.warning("Suno callback missing data")
+        return {
+            "status": "error",
+            "message": "Missing data in callback"
+        }
+
+    callback_type = data.get("callbackType", "complete")
+    task_id = data.get("task_id")
+    tracks_data = data.get("data", [])
+    
+    logger.info("Suno callback: type=%s, task_id=%s, tracks=%d", callback_type, task_id, len(tracks_data))
+
+    # Drop duplicate deliveries (provider retries) using the same TTL map
+    # as kie_callback; key on the callback stage too so "text"/"first"/
+    # "complete" callbacks for one task aren't collapsed together
+    if task_id:
+        dedupe_key = f"suno:{task_id}:{callback_type}"
+        if _already_seen(dedupe_key):
+            logger.info(
+                "Duplicate Suno callback for task %s (%s) - already processed",
+                task_id, callback_type,
+            )
             return {
                 "status": "success",
-                "message": "Callback processed and workflow updated",
+                "message": "Duplicate callback ignored",
                 "callbackType": callback_type,
                 "task_id": task_id,
-                "tracks_count": len(tracks_data),
-                "workflows_updated": updated_count
-            }
-            
-        except Exception as e:
-            logger.error(f"Error updating workflow: {e}", exc_info=True)
-            # Still return success to acknowledge callback receipt
-            # Don't want Kie.ai to retry the callback
-            return {
-                "status": "error",
-                "message": f"Callback received but workflow update failed: {str(e)}",
-                "task_id": task_id
             }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error processing Suno callback: {e}", exc_info=True)
-        # Still return 200 to acknowledge receipt (don't want Kie.ai to retry)
+
+    if not tracks_data or len(tracks_data) == 0:
+        logger.warning("Suno callback has no tracks data")
         return {
             "status": "error",
-            "message": f"Error processing callback: {str(e)}"
+            "message": "No tracks in callback data"
         }
+    
+    # Use the first track (or best track) for the workflow
+    # Usually 2 variations are generated, we'll use the first one
+    first_track = tracks_data[0]
+
+    logger.info(
+        "Generated track: %s (%s) - %s",
+        first_track.get("title", ""),
+        first_track.get("id"),
+        first_track.get("audio_url"),
+    )
+
+    # Mark as seen only now that the payload is processable - a malformed
+    # delivery (no tracks) must not poison the dedupe map and short-circuit
+    # the provider's retried good delivery
+    dedupe_key = f"suno:{task_id}:{callback_type}" if task_id else ""
+    if task_id:
+        _mark_seen(dedupe_key)
+
+    # Ack immediately; the Supabase lookup and updates run after the
+    # response is sent so Kie.ai isn't kept waiting on them (and doesn't
+    # retry on timeout), same pattern as kie_callback - and a processing
+    # failure unmarks the delivery so the retry isn't dropped as a duplicate
+    background_tasks.add_task(_run_marked, dedupe_key, _process_suno_complete, task_id, first_track)
+
+    return {
+        "status": "success",
+        "message": "Callback accepted",
+        "callbackType": callback_type,
+        "task_id": task_id,
+        "tracks_count": len(tracks_data),
+    }
+
 
 
 @router.get("/suno-callback")
 async def suno_callback_get():
     """
     GET endpoint for webhook verification.
-    
+
     Returns:
-        dict: Verification response
+        Response: Verification response (pre-encoded JSON)
     """
-    return {
-        "status": "ok",
-        "message": "Suno webhook endpoint is active"
-    }
+    return Response(content=_SUNO_VERIFICATION_BODY, media_type="application/json")
 
@@ -2,38 +2,72 @@
 FastAPI application entry point.
 """
 
-from fastapi import FastAPI, Request, status, HTTPException
+from fastapi import FastAPI, Request, Response, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from dotenv import load_dotenv
+import importlib
+import logging
+import orjson
 import os
 from pathlib import Path
 
-from app.api import planning, assets, generation, webhooks, learning
+logger = logging.getLogger(__name__)
 
-# Load environment variables
+# Prefer uvloop for any event loop created in this process, even when the
+# server isn't started with --loop uvloop (e.g. ad-hoc uvicorn.run calls).
+# uvicorn[standard] ships uvloop on supported platforms; fall back silently
+# where it isn't available.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # pragma: no cover - platform without uvloop
+    pass
+
+# Load environment variables BEFORE importing the routers, so modules that
+# cache configuration (Supabase credentials etc.) at import time see the
+# values from the .env files.
 # Try to load from root directory .env.local first, then .env, then backend/.env
-root_dir = Path(__file__).parent.parent.parent  # Go up from backend/app/main.py to project root
-env_local = root_dir / ".env.local"
-env_file = root_dir / ".env"
-backend_env = root_dir / "backend" / ".env"
-
-if env_local.exists():
-    load_dotenv(env_local)
-elif env_file.exists():
-    load_dotenv(env_file)
-elif backend_env.exists():
-    load_dotenv(backend_env)
-else:
-    # Fallback to default behavior (looks in current directory)
-    load_dotenv()
+root_dir = Path(__file__).resolve().parents[2]  # Go up from backend/app/main.py to project root
+
+# load_dotenv re-reads and re-parses the file on every call, so guard
+# against module re-execution (test runners, gunicorn --preload) and stop
+# at the first file that exists instead of stat-ing all three
+_DOTENV_LOADED = globals().get("_DOTENV_LOADED", False)
+if not _DOTENV_LOADED:
+    for _env_candidate in (root_dir / ".env.local", root_dir / ".env", root_dir / "backend" / ".env"):
+        if _env_candidate.is_file():
+            load_dotenv(_env_candidate, override=False)
+            break
+    else:
+        # Fallback to default behavior (looks in current directory)
+        load_dotenv(override=False)
+    _DOTENV_LOADED = True
+
+# Import the router modules in worker threads: Python's per-module import
+# locks let distinct modules load concurrently (file reads release the GIL),
+# so cold start tracks the slowest module instead of the sum of all five
+_ROUTER_MODULE_NAMES = ("planning", "assets", "generation", "webhooks", "learning")
+with ThreadPoolExecutor(max_workers=len(_ROUTER_MODULE_NAMES)) as _import_pool:
+    _api_modules = list(_import_pool.map(
+        lambda name: importlib.import_module(f"app.api.{name}"), _ROUTER_MODULE_NAMES
+    ))
+
+from app.services.http_client import close_http_client
+from app.services.supabase_client import warm_supabase_client
 
 app = FastAPI(
     title="AI Music Video Generator API",
     description="API for generating branded music videos from text prompts",
     version="1.0.0",
+    # orjson serializes responses in a single C-level pass, which matters for
+    # the endpoints that return large base64 image payloads
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration
@@ -44,15 +78,84 @@ cors_origins_env = os.getenv(
 # Parse CORS origins: split by comma, strip whitespace, remove trailing slashes, filter out empty strings
 cors_origins = [
     origin.strip().rstrip("/")  # Remove trailing slashes for consistent matching
-    for origin in cors_origins_env.split(",") 
+    for origin in cors_origins_env.split(",")
     if origin.strip()
 ]
 
-# Log CORS configuration for debugging (don't log in production if sensitive)
+# O(1) membership checks for the per-request origin comparisons (the list
+# entries are already normalized without trailing slashes)
+_CORS_ORIGIN_SET = frozenset(cors_origins)
+
+# Per-request CORS debug logging is opt-in: the messages are only useful
+# while diagnosing origin mismatches, and building them on every request
+# serializes traffic on stdout under load
+_CORS_DEBUG = os.getenv("CORS_DEBUG", "0") == "1"
+
+# The non-origin CORS headers attached to error responses never vary; build
+# the mapping once instead of three string assignments per error
+_CORS_ERROR_HEADERS_STATIC = {
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
+# Log CORS configuration for debugging (don't log in production if sensitive).
+# One print call so log collectors see a single write instead of N+1 lines
 if cors_origins:
-    print(f"CORS configured with {len(cors_origins)} allowed origin(s)")
-    for origin in cors_origins:
-        print(f"  - {origin}")
+    print(
+        f"CORS configured with {len(cors_origins)} allowed origin(s):\n"
+        + "\n".join(f"  - {origin}" for origin in cors_origins)
+    )
+
+# Maximum accepted request body size. Base64 reference images are large, but
+# anything beyond this bound would force Pydantic/orjson to parse tens of MB
+# before any business logic runs.
+MAX_REQUEST_BODY_BYTES = 20 * 1024 * 1024  # 20 MB
+
+# 413 payload encoded once - the limit never changes at runtime
+_BODY_TOO_LARGE_BODY = orjson.dumps({
+    "detail": f"Request body too large (limit is {MAX_REQUEST_BODY_BYTES} bytes)"
+})
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject requests whose declared Content-Length exceeds the size bound
+    with a 413 before the body is read or parsed.
+
+    Pure ASGI (no BaseHTTPMiddleware child task), registered first so it
+    sits inside CORSMiddleware - the only clients that hit the limit are
+    browsers uploading large base64 images, and they need the CORS headers
+    on the 413 to read the "body too large" detail.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_REQUEST_BODY_BYTES:
+                        await send({
+                            "type": "http.response.start",
+                            "status": status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            "headers": [
+                                (b"content-type", b"application/json"),
+                                (b"content-length", str(len(_BODY_TOO_LARGE_BODY)).encode("latin-1")),
+                            ],
+                        })
+                        await send({"type": "http.response.body", "body": _BODY_TOO_LARGE_BODY})
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(BodySizeLimitMiddleware)
+
+# Compress responses above 1 KB - the JSON payloads here (storyboards,
+# base64 image lists) compress well and clients all send Accept-Encoding
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 app.add_middleware(
     CORSMiddleware,
@@ -65,59 +168,85 @@ app.add_middleware(
 )
 
 
-class CORSPreflightMiddleware(BaseHTTPMiddleware):
+# Highest-frequency endpoints (load-balancer/k8s probes) bypass origin
+# inspection in the custom middlewares entirely
+_FAST_PATHS = frozenset({"/health", "/"})
+
+# The request's validated Origin, set once by CORSDebugMiddleware so the
+# exception handlers don't re-parse and re-normalize the header
+_allowed_origin: ContextVar[Optional[str]] = ContextVar("_allowed_origin", default=None)
+
+
+def _scope_origin(scope) -> Optional[str]:
+    """Read the Origin header straight out of the ASGI scope, if present."""
+    for name, value in scope["headers"]:
+        if name == b"origin":
+            return value.decode("latin-1")
+    return None
+
+
+class CORSDebugMiddleware:
     """
-    Middleware to explicitly handle OPTIONS preflight requests and ensure CORS headers are set.
-    This runs before CORSMiddleware to catch OPTIONS requests.
+    Pure ASGI middleware that validates the request's Origin once per
+    request (publishing the result via the _allowed_origin ContextVar for
+    the exception handlers) and optionally logs CORS diagnostics.
+
+    Preflight OPTIONS handling itself lives in Starlette's CORSMiddleware;
+    the origins here are already normalized without trailing slashes, so no
+    extra preflight middleware is needed.
     """
-    async def dispatch(self, request: Request, call_next):
-        # Handle OPTIONS preflight requests explicitly
-        if request.method == "OPTIONS":
-            origin = request.headers.get("origin")
-            if origin:
-                # Normalize origin (remove trailing slash) for comparison
-                normalized_origin = origin.rstrip("/")
-                # Check if normalized origin matches any allowed origin (also normalized)
-                if normalized_origin in cors_origins:
-                    print(f"CORS Preflight: Handling OPTIONS request from {origin}")
-                    response = JSONResponse(
-                        status_code=200,
-                        content={}
-                    )
-                    response.headers["Access-Control-Allow-Origin"] = origin
-                    response.headers["Access-Control-Allow-Credentials"] = "true"
-                    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-                    response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, X-Requested-With"
-                    response.headers["Access-Control-Max-Age"] = "3600"
-                    return response
-                else:
-                    print(f"CORS Preflight: WARNING - Origin {origin} (normalized: {normalized_origin}) not in allowed origins: {cors_origins}")
-        
-        return await call_next(request)
-
-
-class CORSDebugMiddleware(BaseHTTPMiddleware):
+
+    def __init__(self, app, origins=None):
+        self.app = app
+        # Instance attribute instead of a module-global lookup per request
+        self._origins = _CORS_ORIGIN_SET if origins is None else origins
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in _FAST_PATHS:
+            return await self.app(scope, receive, send)
+
+        # Normalize and validate the origin once per request; exception
+        # handlers read the result from the ContextVar
+        origin = _scope_origin(scope)
+        allowed = origin if origin and origin.rstrip("/") in self._origins else None
+        _allowed_origin.set(allowed)
+
+        if origin and not allowed:
+            logger.warning(
+                "CORS: Origin %s not in allowed origins: %s - this will cause CORS errors",
+                origin, cors_origins,
+            )
+        elif _CORS_DEBUG and origin:
+            logger.debug("CORS Debug: Origin %s is allowed", origin)
+
+        await self.app(scope, receive, send)
+
+
+# Add CORS debug/origin-tracking middleware (runs before CORSMiddleware)
+app.add_middleware(CORSDebugMiddleware, origins=_CORS_ORIGIN_SET)
+
+def _apply_cors(request: Request, response: ORJSONResponse) -> ORJSONResponse:
     """
-    Middleware to log CORS-related information for debugging.
+    Attach CORS headers to an error response when the request's origin is
+    allowed.
+
+    Shared tail for the exception handlers below. The validated origin
+    normally comes from the ContextVar set by CORSDebugMiddleware, but the
+    catch-all Exception handler runs in ServerErrorMiddleware - outermost
+    in the stack - where a set made inside a middleware-spawned child task
+    would not be visible. When the ContextVar is unset, fall back to
+    validating the Origin header directly (one frozenset lookup). Mismatch
+    diagnostics live in the middlewares.
     """
-    async def dispatch(self, request: Request, call_next):
-        origin = request.headers.get("origin")
-        if origin:
-            normalized_origin = origin.rstrip("/")
-            print(f"CORS Debug: Request from origin: {origin} (normalized: {normalized_origin})")
-            print(f"CORS Debug: Allowed origins: {cors_origins}")
-            if normalized_origin in cors_origins:
-                print(f"CORS Debug: ✅ Origin {origin} is allowed")
-            else:
-                print(f"CORS Debug: WARNING - Origin {origin} (normalized: {normalized_origin}) not in allowed origins list")
-                print(f"CORS Debug: This will cause CORS errors!")
-        return await call_next(request)
-
-
-# Add CORS preflight middleware first (runs last, so handles OPTIONS before other middleware)
-app.add_middleware(CORSPreflightMiddleware)
-# Add CORS debug middleware (always enabled to help debug CORS issues)
-app.add_middleware(CORSDebugMiddleware)
+    origin = _allowed_origin.get()
+    if origin is None:
+        raw_origin = request.headers.get("origin")
+        if raw_origin and raw_origin.rstrip("/") in _CORS_ORIGIN_SET:
+            origin = raw_origin
+    if origin:
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers.update(_CORS_ERROR_HEADERS_STATIC)
+    return response
 
 
 @app.exception_handler(RequestValidationError)
@@ -135,30 +264,16 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error.get("type", "unknown")
         })
     
-    print(f"Validation error: {error_details}")
+    logger.warning("Validation error: %s", error_details)
     
-    # Get origin from request headers
-    origin = request.headers.get("origin")
-    
-    # Create response with CORS headers
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
             "detail": "Validation error",
             "errors": error_details
         }
     )
-    
-    # Add CORS headers if origin is in allowed origins (normalize for comparison)
-    if origin:
-        normalized_origin = origin.rstrip("/")
-        if normalized_origin in cors_origins:
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "*"
-            response.headers["Access-Control-Allow-Headers"] = "*"
-    
-    return response
+    return _apply_cors(request, response)
 
 
 @app.exception_handler(HTTPException)
@@ -166,27 +281,28 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """
     Handler for HTTPException to ensure CORS headers are included.
     """
-    # Get origin from request headers
-    origin = request.headers.get("origin")
-    
-    # Create response with CORS headers
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
-    
-    # Add CORS headers if origin is in allowed origins (normalize for comparison)
-    if origin:
-        normalized_origin = origin.rstrip("/")
-        if normalized_origin in cors_origins:
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "*"
-            response.headers["Access-Control-Allow-Headers"] = "*"
-        else:
-            print(f"CORS Warning: Origin {origin} (normalized: {normalized_origin}) not in allowed origins: {cors_origins}")
-    
-    return response
+    return _apply_cors(request, response)
+
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Handler for ValueError raised by services (bad input, missing API keys).
+
+    Centralizes the per-endpoint `except ValueError: raise HTTPException(400)`
+    boilerplate. Ensures CORS headers are included.
+    """
+    logger.warning("Value error: %s", exc)
+
+    response = ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+    return _apply_cors(request, response)
 
 
 @app.exception_handler(Exception)
@@ -195,65 +311,69 @@ async def general_exception_handler(request: Request, exc: Exception):
     Catch-all exception handler for unexpected errors.
     Ensures CORS headers are included in error responses.
     """
-    import traceback
-    error_trace = traceback.format_exc()
-    print(f"Unexpected error: {error_trace}")
-    
-    # Get origin from request headers
-    origin = request.headers.get("origin")
-    
-    # Create response with CORS headers
-    response = JSONResponse(
+    # logger.exception only stringifies the traceback if ERROR is enabled,
+    # unlike the old unconditional traceback.format_exc() + print
+    logger.exception("Unhandled error: %s", exc)
+
+    response = ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": f"Internal server error: {str(exc)}",
             "type": type(exc).__name__
         }
     )
-    
-    # Add CORS headers if origin is in allowed origins (normalize for comparison)
-    if origin:
-        normalized_origin = origin.rstrip("/")
-        if normalized_origin in cors_origins:
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "*"
-            response.headers["Access-Control-Allow-Headers"] = "*"
-    
-    return response
+    return _apply_cors(request, response)
 
 
 # Include routers
-app.include_router(planning.router)
-app.include_router(assets.router)
-app.include_router(generation.router)
-app.include_router(webhooks.router)
-app.include_router(learning.router)
+for _api_module in _api_modules:
+    app.include_router(_api_module.router)
+
+
+@app.on_event("startup")
+async def warm_clients():
+    """Build the shared Supabase client so the first request doesn't pay for it."""
+    if warm_supabase_client():
+        print("Supabase client warmed at startup")
+    else:
+        print("Supabase not configured - skipping client warm-up")
+
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Close the shared outbound HTTP client and its connection pool."""
+    await close_http_client()
+
+
+# Static response bodies, encoded once at import time - these endpoints
+# return the same payload on every request
+_ROOT_BODY = orjson.dumps({
+    "message": "AI Music Video Generator API",
+    "version": "1.0.0",
+    "docs": "/docs",
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
 
-@app.get("/")
+@app.get("/", include_in_schema=False, response_class=Response)
 async def root():
     """
     Root endpoint.
 
     Returns:
-        dict: API information
+        Response: API information (pre-encoded JSON)
     """
-    return {
-        "message": "AI Music Video Generator API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False, response_class=Response)
 async def health_check():
     """
     Health check endpoint.
 
     Returns:
-        dict: Health status
+        Response: Health status (pre-encoded JSON)
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
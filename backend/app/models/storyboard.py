@@ -3,7 +3,7 @@ Pydantic models for storyboard data structures.
 """
 
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class StoryboardShot(BaseModel):
@@ -17,22 +17,26 @@ class StoryboardShot(BaseModel):
         base_video_prompt: The video generation prompt for this shot
     """
 
-    line_index: int = Field(..., ge=1, description="Sequential index starting from 1")
-    lyric_line: str = Field(..., min_length=1, description="The lyric text for this shot")
-    duration_seconds: float = Field(..., gt=0, description="Duration in seconds")
-    base_video_prompt: str = Field(
-        ..., min_length=1, description="Video generation prompt for this shot"
-    )
-
-    class Config:
-        json_schema_extra = {
+    # Shots are never mutated after construction; frozen lets pydantic-core
+    # skip the assignment-validation machinery on this per-shot hot path
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "line_index": 1,
                 "lyric_line": "The neon city sleeps beneath a digital rain,",
                 "duration_seconds": 3.0,
                 "base_video_prompt": "Cinematic high-angle shot of a lone figure standing on a skyscraper rooftop, looking down at neon streets. Heavy fog.",
             }
-        }
+        },
+    )
+
+    line_index: int = Field(..., ge=1, description="Sequential index starting from 1")
+    lyric_line: str = Field(..., min_length=1, description="The lyric text for this shot")
+    duration_seconds: float = Field(..., gt=0, description="Duration in seconds")
+    base_video_prompt: str = Field(
+        ..., min_length=1, description="Video generation prompt for this shot"
+    )
 
 
 class Storyboard(BaseModel):
@@ -49,13 +53,14 @@ class Storyboard(BaseModel):
     shots: List[StoryboardShot] = Field(..., min_items=1, description="List of storyboard shots")
     theme: str = Field(..., min_length=1, description="Overall theme of the video")
     style_guide: str = Field(..., min_length=1, description="Visual style guide text")
-    total_duration: float = Field(default=0.0, description="Total duration in seconds")
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Calculate total duration
-        if self.shots:
-            self.total_duration = sum(shot.duration_seconds for shot in self.shots)
+    # Derived from the shots rather than stored, so construction stays on
+    # pydantic-core's fast path (the old __init__ override re-summed the
+    # shots on every deserialization); still serialized like a normal field
+    @computed_field(description="Total duration in seconds")
+    @property
+    def total_duration(self) -> float:
+        return sum(shot.duration_seconds for shot in self.shots)
 
     class Config:
         json_schema_extra = {
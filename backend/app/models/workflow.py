@@ -3,7 +3,7 @@ Pydantic models for workflow state and data structures.
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from app.models.storyboard import Storyboard, StoryboardShot
 
 
@@ -21,6 +21,9 @@ class ReferenceImage(BaseModel):
         saved_to_style_guide: Whether saved to style guide (optional)
     """
 
+    # Instantiated once per generated image and read-only afterwards
+    model_config = ConfigDict(frozen=True)
+
     image_id: str = Field(..., description="Unique identifier")
     base64_data: str = Field(..., description="Base64 encoded PNG data")
     description: str = Field(..., description="Description of the image")
@@ -60,6 +63,9 @@ class VideoClip(BaseModel):
         final_prompt: The complete prompt used for generation
     """
 
+    # One instance per generated clip, never mutated after construction
+    model_config = ConfigDict(frozen=True)
+
     shot_index: int = Field(..., ge=1, description="Corresponding shot index")
     clip_url: str = Field(..., description="URL or path to clip file")
     duration_seconds: float = Field(..., gt=0, description="Duration in seconds")
@@ -105,11 +111,16 @@ class FinalVideoPrompt(BaseModel):
         reference_image_ids: IDs of reference images to use
     """
 
+    # Built once per shot during prompt assembly and read-only afterwards
+    model_config = ConfigDict(frozen=True)
+
     shot_index: int = Field(..., ge=1, description="Storyboard shot index")
     final_prompt: str = Field(..., description="Complete prompt with style guide")
     duration_seconds: float = Field(..., gt=0, description="Duration in seconds")
-    reference_image_ids: List[str] = Field(
-        default_factory=list, description="Reference image IDs to use"
+    # Read-only id collection on a frozen model: a tuple avoids allocating a
+    # fresh list default per instance and matches the immutability contract
+    reference_image_ids: tuple[str, ...] = Field(
+        default=(), description="Reference image IDs to use"
     )
 
 
@@ -2,31 +2,88 @@
 Service for generating storyboards using Google Gemini API.
 """
 
-import json
 import os
-import base64
+import re
+from functools import lru_cache
 from typing import List, Dict, Any
 import google.generativeai as genai
+import orjson
 from app.models.storyboard import Storyboard, StoryboardShot, StoryboardGenerationRequest
+from app.utils import decode_data_uri
 
 
-# Initialize Gemini client
+@lru_cache(maxsize=1)
 def _get_gemini_client():
     """
-    Initialize and return Gemini client.
+    Return the process-wide Gemini model, configuring the SDK on first use.
+
+    genai.configure and GenerativeModel construction are not free, so pay
+    for them once per worker instead of on every generation call.
 
     Returns:
         GenerativeModel: Configured Gemini model instance
+
+    Raises:
+        ValueError: If the API key is not configured
     """
     api_key = os.getenv("GOOGLE_AI_API_KEY")
     if not api_key:
         raise ValueError("GOOGLE_AI_API_KEY environment variable not set")
-    
+
     genai.configure(api_key=api_key)
     # Using Gemini 2.5 Flash as specified in plan
     return genai.GenerativeModel("gemini-2.0-flash-exp")
 
 
+def _reset_client() -> None:
+    """Drop the cached model (tests, API key rotation)."""
+    _get_gemini_client.cache_clear()
+
+
+# Content-detection keywords, scanned against a single lowercased copy of
+# the style guide (extend the tuples rather than adding more .lower() scans)
+_CHILDREN_TOKENS = ("children", "lullaby", "toddler", "baby")
+_CHILDREN_PHRASES = re.compile(r"under\s*[25]")
+_CHRISTIAN_TOKENS = ("christian", "biblical", "faith", "values")
+
+# Static prompt fragments, built once at import - only the theme/style/
+# shot-count/duration interpolation varies per request
+_CHILDREN_BLOCK = """
+
+CHILDREN'S CONTENT REQUIREMENTS (Ages 0-5):
+- Lyrics must be age-appropriate, simple, and easy to understand
+- For lullabies (ages 0-2): Focus on calming, sleep-inducing themes (stars, moons, dreams, peaceful nature)
+- For educational content (ages 2-5): Include positive messages and simple life lessons
+- Avoid any scary, dark, or intense themes
+- Use gentle, soothing language
+- Visual prompts should be calming and peaceful
+- Maintain a consistent, friendly tone throughout"""
+
+_CHRISTIAN_BLOCK = """
+
+CHRISTIAN VALUES INTEGRATION:
+- Naturally integrate biblical themes and Christian values into lyrics
+- Focus on: love, kindness, forgiveness, gratitude, honesty, helping others
+- Use age-appropriate biblical stories and parables (Noah's Ark, Good Samaritan, etc.)
+- Visual prompts should show positive role models demonstrating Christian character
+- Emphasize community, fellowship, and caring for others
+- Use nature and creation themes that reflect God's love
+- Ensure all content aligns with Christian values and teachings"""
+
+_PROMPT_TRAILER = "\n\nOutput ONLY the JSON array, nothing else."
+
+# Markdown code fence around a model response (``` or ```json, any case,
+# closing fence optional) - one match instead of four startswith/endswith
+# slicings, each of which allocated an intermediate copy of the response
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL | re.IGNORECASE)
+
+
+def _strip_markdown_fences(response_text: str) -> str:
+    """Return the response body with any surrounding markdown fences removed."""
+    fence_match = _FENCE_RE.match(response_text)
+    return fence_match.group(1) if fence_match else response_text
+
+
 def generate_storyboard(request: StoryboardGenerationRequest) -> Storyboard:
     """
     Generate a storyboard with lyrics and video prompts using Gemini.
@@ -43,24 +100,16 @@ def generate_storyboard(request: StoryboardGenerationRequest) -> Storyboard:
     """
     model = _get_gemini_client()
     
-    # Detect if this is children's content
+    # Detect if this is children's/Christian content - one lowercase pass
+    style_guide_lower = request.style_guide.lower()
     is_childrens_content = (
-        "children" in request.style_guide.lower() or 
-        "lullaby" in request.style_guide.lower() or 
-        "under 2" in request.style_guide.lower() or 
-        "under 5" in request.style_guide.lower() or
-        "toddler" in request.style_guide.lower() or
-        "baby" in request.style_guide.lower()
-    )
-    is_christian_content = (
-        "christian" in request.style_guide.lower() or 
-        "biblical" in request.style_guide.lower() or 
-        "faith" in request.style_guide.lower() or
-        "values" in request.style_guide.lower()
+        any(token in style_guide_lower for token in _CHILDREN_TOKENS)
+        or _CHILDREN_PHRASES.search(style_guide_lower) is not None
     )
+    is_christian_content = any(token in style_guide_lower for token in _CHRISTIAN_TOKENS)
     
     # Construct system prompt with explicit JSON structure requirement
-    system_prompt = f"""You are a creative director generating a music video storyboard.
+    header = f"""You are a creative director generating a music video storyboard.
 
 Theme: {request.theme}
 Style Guide: {request.style_guide}
@@ -92,50 +141,21 @@ Requirements:
 - Total duration should be approximately {request.max_duration if request.max_duration else "30-60"} seconds
 - Make lyrics creative and match the theme
 - Each base_video_prompt should be detailed and cinematic"""
-    
-    # Add children's content guidelines
-    if is_childrens_content:
-        system_prompt += """
 
-CHILDREN'S CONTENT REQUIREMENTS (Ages 0-5):
-- Lyrics must be age-appropriate, simple, and easy to understand
-- For lullabies (ages 0-2): Focus on calming, sleep-inducing themes (stars, moons, dreams, peaceful nature)
-- For educational content (ages 2-5): Include positive messages and simple life lessons
-- Avoid any scary, dark, or intense themes
-- Use gentle, soothing language
-- Visual prompts should be calming and peaceful
-- Maintain a consistent, friendly tone throughout"""
-    
-    # Add Christian values integration
+    # Assemble in one pass instead of repeated += reallocations
+    parts = [header]
+    if is_childrens_content:
+        parts.append(_CHILDREN_BLOCK)
     if is_christian_content:
-        system_prompt += """
-
-CHRISTIAN VALUES INTEGRATION:
-- Naturally integrate biblical themes and Christian values into lyrics
-- Focus on: love, kindness, forgiveness, gratitude, honesty, helping others
-- Use age-appropriate biblical stories and parables (Noah's Ark, Good Samaritan, etc.)
-- Visual prompts should show positive role models demonstrating Christian character
-- Emphasize community, fellowship, and caring for others
-- Use nature and creation themes that reflect God's love
-- Ensure all content aligns with Christian values and teachings"""
-    
-    system_prompt += "\n\nOutput ONLY the JSON array, nothing else."
+        parts.append(_CHRISTIAN_BLOCK)
+    parts.append(_PROMPT_TRAILER)
+    system_prompt = "".join(parts)
 
     try:
         response = model.generate_content(system_prompt)
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-        
-        # Parse JSON
-        shots_data = json.loads(response_text)
+
+        # Parse JSON (minus any markdown code fences)
+        shots_data = orjson.loads(_strip_markdown_fences(response.text))
         
         # Validate and create StoryboardShot objects
         shots = []
@@ -154,7 +174,7 @@ CHRISTIAN VALUES INTEGRATION:
         
         return storyboard
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from Gemini response: {e}")
     except Exception as e:
         raise Exception(f"Gemini API error: {e}")
@@ -198,26 +218,9 @@ def analyze_style_from_images(images: List[str]) -> Dict[str, Any]:
     # Extract base64 data from data URIs
     image_parts = []
     for img_data_uri in images:
-        mime_type = "image/png"  # Default
-        
-        # Handle data URI format: data:image/png;base64,<base64_data>
-        if img_data_uri.startswith("data:"):
-            # Extract mime type and base64 data
-            parts = img_data_uri.split(",", 1)
-            header = parts[0]  # data:image/png;base64
-            base64_data = parts[1]
-            
-            # Extract mime type from header
-            if "image/" in header:
-                mime_part = header.split("image/")[1].split(";")[0]
-                mime_type = f"image/{mime_part}"
-        else:
-            # Assume it's already base64
-            base64_data = img_data_uri
-        
-        # Decode base64 to bytes for Gemini
+        # Decode straight from the data URI - no intermediate payload string
         try:
-            image_bytes = base64.b64decode(base64_data)
+            mime_type, image_bytes = decode_data_uri(img_data_uri)
             image_parts.append({
                 "mime_type": mime_type,
                 "data": image_bytes
@@ -276,19 +279,9 @@ Be thorough and specific. Extract every visual detail that would help recreate t
     try:
         # Use Gemini Vision API with multiple images
         response = model.generate_content([analysis_prompt] + image_parts)
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-        
-        # Parse JSON response
-        style_data = json.loads(response_text)
+
+        # Parse JSON response (minus any markdown code fences)
+        style_data = orjson.loads(_strip_markdown_fences(response.text))
         
         # Ensure all required fields exist with defaults
         result = {
@@ -305,7 +298,7 @@ Be thorough and specific. Extract every visual detail that would help recreate t
         
         return result
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from Gemini response: {e}")
     except Exception as e:
         raise Exception(f"Gemini Vision API error: {e}")
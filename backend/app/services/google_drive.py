@@ -3,9 +3,11 @@ Service for storing reference images in Google Drive.
 Creates a folder for each workflow/project and stores images there.
 """
 
+import asyncio
 import os
-import base64
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import List, Optional
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -15,24 +17,37 @@ from googleapiclient.errors import HttpError
 import io
 import json
 
+from app.utils import decode_data_uri
+
 # Google Drive API scopes
 SCOPES = ['https://www.googleapis.com/auth/drive.file']  # Read/write access to files created by the app
 
 # Folder name for storing all project folders
 PROJECTS_FOLDER_NAME = "AI Music Video Generator Projects"
 
+# Bound concurrent Drive writes - Drive allows roughly 10 writes/sec per user,
+# so 8 in flight keeps us under the quota while still pipelining round-trips
+_DRIVE_MAX_CONCURRENCY = 8
+_drive_semaphore = asyncio.Semaphore(_DRIVE_MAX_CONCURRENCY)
 
-def _get_google_drive_service():
+
+# Per-thread service cache: the httplib2 transport inside a Discovery client
+# is not thread-safe, and uploads run concurrently on asyncio.to_thread
+# workers, so the cache is per worker thread rather than process-wide
+_drive_local = threading.local()
+
+
+def _build_google_drive_service():
     """
     Initialize and return Google Drive service.
-    
+
     Supports both:
     1. credentials.json file (traditional OAuth flow)
     2. Environment variables (GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET) for serverless deployments
-    
+
     Returns:
         Resource: Google Drive API service instance
-        
+
     Raises:
         ValueError: If credentials are missing or invalid
     """
@@ -101,7 +116,29 @@ def _get_google_drive_service():
             with open(token_file, 'w') as token:
                 token.write(creds.to_json())
     
-    return build('drive', 'v3', credentials=creds)
+    # static_discovery skips fetching the discovery document over HTTP on
+    # every cold build; the v3 schema ships with the client library
+    return build('drive', 'v3', credentials=creds, cache_discovery=False, static_discovery=True)
+
+
+def _get_google_drive_service():
+    """
+    Return this thread's cached Drive service, building it on first use.
+
+    Rebuilding per call re-reads token.json and reconstructs the Discovery
+    client every time; caching keeps that to once per worker thread.
+
+    Returns:
+        Resource: Google Drive API service instance
+
+    Raises:
+        ValueError: If credentials are missing or invalid
+    """
+    service = getattr(_drive_local, "service", None)
+    if service is None:
+        service = _build_google_drive_service()
+        _drive_local.service = service
+    return service
 
 
 def _find_or_create_folder(service, folder_name: str, parent_folder_id: Optional[str] = None) -> str:
@@ -143,71 +180,72 @@ def _find_or_create_folder(service, folder_name: str, parent_folder_id: Optional
         raise Exception(f"Error finding/creating folder: {error}")
 
 
-def _get_projects_folder_id(service) -> str:
+@lru_cache(maxsize=1)
+def _get_projects_folder_id() -> str:
     """
     Get or create the main projects folder.
-    
-    Args:
-        service: Google Drive API service instance
-        
+
+    Folder IDs are stable, so the files.list round-trip only happens once
+    per process instead of once per upload.
+
     Returns:
         str: Projects folder ID
     """
-    return _find_or_create_folder(service, PROJECTS_FOLDER_NAME)
+    return _find_or_create_folder(_get_google_drive_service(), PROJECTS_FOLDER_NAME)
 
 
-def _get_workflow_folder_id(service, workflow_id: str) -> str:
+@lru_cache(maxsize=256)
+def _get_workflow_folder_id(workflow_id: str) -> str:
     """
     Get or create a folder for a specific workflow.
-    
+
+    Memoized per workflow - repeat uploads into the same workflow skip the
+    lookup round-trip entirely.
+
     Args:
-        service: Google Drive API service instance
         workflow_id: Unique workflow identifier
-        
+
     Returns:
         str: Workflow folder ID
     """
-    projects_folder_id = _get_projects_folder_id(service)
-    folder_name = f"Workflow_{workflow_id}"
-    return _find_or_create_folder(service, folder_name, projects_folder_id)
+    return _find_or_create_folder(
+        _get_google_drive_service(), f"Workflow_{workflow_id}", _get_projects_folder_id()
+    )
 
 
-async def upload_image_to_drive(
+# Permission body granting public read access - identical for every upload
+_PUBLIC_READER_PERMISSION = {
+    'type': 'anyone',
+    'role': 'reader'
+}
+
+
+def _shareable_url(file_id: str) -> str:
+    """Build the public view URL for a Drive file ID."""
+    return f"https://drive.google.com/uc?export=view&id={file_id}"
+
+
+def _create_drive_file_sync(
     image_data_base64: str,
     image_id: str,
     workflow_id: str,
     description: str
 ) -> str:
     """
-    Upload an image to Google Drive in the workflow's folder.
-    
-    Args:
-        image_data_base64: Base64 encoded image data (data URI format)
-        image_id: Unique identifier for the image
-        workflow_id: Workflow/project identifier
-        description: Description of the image
-        
-    Returns:
-        str: Public shareable URL of the uploaded image
-        
-    Raises:
-        Exception: If upload fails
+    Upload one image's media to the workflow folder and return its file ID.
+
+    Does NOT set any permission - single-image callers add it themselves,
+    bulk callers batch the permission grants afterwards.
     """
     try:
         service = _get_google_drive_service()
-        
+
         # Get or create workflow folder
-        workflow_folder_id = _get_workflow_folder_id(service, workflow_id)
-        
-        # Convert base64 to bytes
-        if image_data_base64.startswith("data:image"):
-            # Remove data URI prefix
-            base64_data = image_data_base64.split(",")[1]
-        else:
-            base64_data = image_data_base64
-        
-        image_bytes = base64.b64decode(base64_data)
-        
+        workflow_folder_id = _get_workflow_folder_id(workflow_id)
+
+        # Convert base64 to bytes (strips any data URI prefix)
+        _, image_bytes = decode_data_uri(image_data_base64)
+
         # Create file metadata
         filename = f"{image_id}.png"
         file_metadata = {
@@ -215,56 +253,154 @@ async def upload_image_to_drive(
             'parents': [workflow_folder_id],
             'description': description
         }
-        
+
         # Upload file
         media = MediaIoBaseUpload(
             io.BytesIO(image_bytes),
             mimetype='image/png',
             resumable=True
         )
-        
+
         file = service.files().create(
             body=file_metadata,
             media_body=media,
             fields='id'
         ).execute()
-        
-        file_id = file.get('id')
-        
+
+        return file.get('id')
+
+    except HttpError as error:
+        raise Exception(f"Google Drive API error: {error}")
+    except Exception as error:
+        raise Exception(f"Error uploading image to Google Drive: {error}")
+
+
+def _share_files_sync(file_ids: List[str]) -> None:
+    """
+    Grant public-reader permission to all file IDs in one batched HTTP
+    request (one round-trip instead of one per file).
+    """
+    service = _get_google_drive_service()
+    errors = []
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+
+    batch = service.new_batch_http_request(callback=_collect)
+    for file_id in file_ids:
+        batch.add(service.permissions().create(fileId=file_id, body=_PUBLIC_READER_PERMISSION))
+
+    try:
+        batch.execute()
+    except HttpError as error:
+        raise Exception(f"Google Drive API error: {error}")
+    if errors:
+        raise Exception(f"Google Drive API error: {errors[0]}")
+
+
+def _upload_image_to_drive_sync(
+    image_data_base64: str,
+    image_id: str,
+    workflow_id: str,
+    description: str
+) -> str:
+    """
+    Synchronous Drive upload - run via asyncio.to_thread so the blocking
+    Drive SDK calls never run on the event loop.
+    """
+    file_id = _create_drive_file_sync(image_data_base64, image_id, workflow_id, description)
+
+    try:
         # Make file publicly viewable
-        permission = {
-            'type': 'anyone',
-            'role': 'reader'
-        }
+        service = _get_google_drive_service()
         service.permissions().create(
             fileId=file_id,
-            body=permission
+            body=_PUBLIC_READER_PERMISSION
         ).execute()
-        
-        # Get shareable URL
-        shareable_url = f"https://drive.google.com/uc?export=view&id={file_id}"
-        
-        return shareable_url
-        
     except HttpError as error:
         raise Exception(f"Google Drive API error: {error}")
-    except Exception as error:
-        raise Exception(f"Error uploading image to Google Drive: {error}")
 
+    return _shareable_url(file_id)
 
-async def delete_image_from_drive(file_url: str) -> None:
+
+async def upload_image_to_drive(
+    image_data_base64: str,
+    image_id: str,
+    workflow_id: str,
+    description: str
+) -> str:
     """
-    Delete an image from Google Drive.
-    
+    Upload an image to Google Drive in the workflow's folder.
+
+    The blocking Drive SDK work runs on a worker thread, bounded by a
+    semaphore so batch callers don't exceed Drive's write quota.
+
     Args:
-        file_url: Google Drive file URL or file ID
-        
+        image_data_base64: Base64 encoded image data (data URI format)
+        image_id: Unique identifier for the image
+        workflow_id: Workflow/project identifier
+        description: Description of the image
+
+    Returns:
+        str: Public shareable URL of the uploaded image
+
     Raises:
-        Exception: If deletion fails
+        Exception: If upload fails
+    """
+    async with _drive_semaphore:
+        return await asyncio.to_thread(
+            _upload_image_to_drive_sync,
+            image_data_base64,
+            image_id,
+            workflow_id,
+            description,
+        )
+
+
+async def upload_images_to_drive(images: List[dict]) -> List[str]:
+    """
+    Upload multiple images to Google Drive concurrently.
+
+    Media uploads are pipelined with asyncio.gather (Drive cannot batch
+    media), with per-upload concurrency bounded by the module semaphore;
+    the permission grants then go out in a single BatchHttpRequest instead
+    of one round-trip per image.
+
+    Args:
+        images: List of dicts with image_data_base64, image_id, workflow_id,
+                and description keys (the upload_image_to_drive arguments)
+
+    Returns:
+        List[str]: Public shareable URLs, in the same order as the input
+
+    Raises:
+        Exception: If any upload fails
+    """
+    async def _create(image: dict) -> str:
+        async with _drive_semaphore:
+            return await asyncio.to_thread(
+                _create_drive_file_sync,
+                image["image_data_base64"],
+                image["image_id"],
+                image["workflow_id"],
+                image.get("description", ""),
+            )
+
+    file_ids = list(await asyncio.gather(*(_create(image) for image in images)))
+    if file_ids:
+        await asyncio.to_thread(_share_files_sync, file_ids)
+    return [_shareable_url(file_id) for file_id in file_ids]
+
+
+def _delete_image_from_drive_sync(file_url: str) -> None:
+    """
+    Synchronous Drive delete - run via asyncio.to_thread so the blocking
+    SDK call never runs on the event loop.
     """
     try:
         service = _get_google_drive_service()
-        
+
         # Extract file ID from URL
         if "id=" in file_url:
             file_id = file_url.split("id=")[1].split("&")[0]
@@ -273,11 +409,29 @@ async def delete_image_from_drive(file_url: str) -> None:
             file_id = file_url.split("/")[-1]
         else:
             file_id = file_url
-        
+
         service.files().delete(fileId=file_id).execute()
-        
+
     except HttpError as error:
         raise Exception(f"Google Drive API error: {error}")
     except Exception as error:
         raise Exception(f"Error deleting image from Google Drive: {error}")
 
+
+async def delete_image_from_drive(file_url: str) -> None:
+    """
+    Delete an image from Google Drive.
+
+    The blocking Drive SDK call runs on a worker thread, bounded by the
+    same semaphore as uploads; concurrent deletions can be overlapped with
+    asyncio.gather.
+
+    Args:
+        file_url: Google Drive file URL or file ID
+
+    Raises:
+        Exception: If deletion fails
+    """
+    async with _drive_semaphore:
+        await asyncio.to_thread(_delete_image_from_drive_sync, file_url)
+
@@ -0,0 +1,39 @@
+"""
+Shared httpx.AsyncClient for outbound API calls.
+
+Creating an AsyncClient per request throws away the connection pool and TLS
+session, so every call to Kie.ai/OpenAI pays the full TCP + TLS handshake
+again. All services share this single client instead; app.main closes it on
+shutdown.
+"""
+
+from typing import Optional
+
+import httpx
+
+# Generous pool sizes - image generation fans out many concurrent downloads
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Pooled client with HTTP/2 enabled. Callers pass
+        per-request timeouts and must NOT close the client themselves.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(http2=True, limits=_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the app shutdown hook)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
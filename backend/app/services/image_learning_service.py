@@ -3,11 +3,12 @@ Service for learning from user feedback on generated images.
 Analyzes approved/favorited images to improve future generations.
 """
 
-import os
+import asyncio
 import json
 from typing import List, Dict, Any, Optional
 import httpx
 from app.models.workflow import ReferenceImage
+from app.services.supabase_client import get_supabase
 
 
 async def analyze_approved_image(
@@ -158,21 +159,22 @@ async def get_learning_insights(
         - recommendations: Suggestions for future generations
     """
     try:
-        from supabase import create_client, Client
-        
-        supabase_url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-        
-        if not supabase_url or not supabase_key:
+        # Shared client - credentials are resolved once at import time and
+        # the underlying HTTP session is reused across requests
+        try:
+            supabase = get_supabase()
+        except ValueError:
             return {
                 "common_characteristics": {},
                 "recommendations": "No Supabase configuration found"
             }
-        
-        supabase: Client = create_client(supabase_url, supabase_key)
-        
-        # Query approved/favorited images
-        query = supabase.table("image_feedback").select("*")
+
+        # Query approved/favorited images - only the two JSONB columns the
+        # aggregation below reads, not the full rows (prompt_used and
+        # style_guide alone can be kilobytes each)
+        query = supabase.table("image_feedback").select(
+            "visual_characteristics, success_factors"
+        )
         
         if channel_name:
             query = query.eq("channel_name", channel_name)
@@ -181,8 +183,10 @@ async def get_learning_insights(
         
         query = query.eq("approved", True).or_("favorited.eq.true")
         query = query.order("created_at", desc=True).limit(limit)
-        
-        response = query.execute()
+
+        # supabase-py is synchronous - run the round trip off the event loop
+        # so concurrent requests aren't serialized behind it
+        response = await asyncio.to_thread(query.execute)
         
         if not response.data or len(response.data) == 0:
             return {
@@ -9,6 +9,7 @@ from typing import List
 import httpx
 import json
 from app.models.workflow import ReferenceImage
+from app.services.http_client import get_http_client
 from app.services.task_manager import get_task_manager
 from dotenv import load_dotenv
 from pathlib import Path
@@ -255,72 +256,72 @@ CHRISTIAN VALUES & CONTENT GUIDELINES:
         print(f"  Quality: {request_payload['quality']}")
         print(f"  Prompt: {prompt[:200]}...")
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                dalle_api_url,
-                json=request_payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=60.0,  # Image generation can take time
-            )
-            
-            print(f"Response status: {response.status_code}")
-            print(f"Response content-type: {response.headers.get('content-type', 'unknown')}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                # DALL-E returns base64 in b64_json format
-                if "data" in data and len(data["data"]) > 0:
-                    image_base64 = data["data"][0]["b64_json"]
-                    # Ensure proper data URI format
-                    if not image_base64.startswith("data:image"):
-                        image_base64 = f"data:image/png;base64,{image_base64}"
-                else:
-                    raise ValueError("DALL-E API did not return image data in response")
-            elif response.status_code == 401:
-                raise ValueError("Invalid OpenAI API key. Please check your OPENAI_API_KEY.")
-            elif response.status_code == 429:
-                raise ValueError(
-                    "OpenAI API rate limit exceeded. Please wait a moment and try again."
-                )
-            elif response.status_code == 400:
-                # Try to get detailed error from OpenAI API
-                try:
-                    error_data = response.json()
-                    error_info = error_data.get("error", {})
-                    error_msg = error_info.get("message", "Unknown error")
-                    error_type = error_info.get("type", "Unknown type")
-                    error_code = error_info.get("code", "Unknown code")
-                    
-                    # Log full error for debugging
-                    print(f"DALL-E 400 Error Details:")
-                    print(f"  Type: {error_type}")
-                    print(f"  Code: {error_code}")
-                    print(f"  Message: {error_msg}")
-                    print(f"  Full response: {error_data}")
-                    print(f"  Prompt length: {len(prompt)} characters")
-                    print(f"  Prompt preview: {prompt[:100]}...")
-                    
-                    raise ValueError(f"DALL-E API error ({error_type}): {error_msg}")
-                except Exception as parse_error:
-                    # If we can't parse JSON, show raw response
-                    error_text = response.text if hasattr(response, 'text') else str(response.content[:500])
-                    print(f"DALL-E 400 Error (unparseable): {error_text}")
-                    raise ValueError(f"DALL-E API error: {error_text}")
+        client = get_http_client()
+        response = await client.post(
+            dalle_api_url,
+            json=request_payload,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=60.0,  # Image generation can take time
+        )
+
+        print(f"Response status: {response.status_code}")
+        print(f"Response content-type: {response.headers.get('content-type', 'unknown')}")
+
+        if response.status_code == 200:
+            data = response.json()
+            # DALL-E returns base64 in b64_json format
+            if "data" in data and len(data["data"]) > 0:
+                image_base64 = data["data"][0]["b64_json"]
+                # Ensure proper data URI format
+                if not image_base64.startswith("data:image"):
+                    image_base64 = f"data:image/png;base64,{image_base64}"
             else:
-                # For other status codes, try to get error message
-                try:
-                    error_data = response.json()
-                    error_info = error_data.get("error", {})
-                    error_msg = error_info.get("message", response.text[:500])
-                except:
-                    error_msg = response.text[:500] if hasattr(response, 'text') else str(response.content[:500])
-                
-                print(f"DALL-E API Error Status {response.status_code}: {error_msg}")
-                raise ValueError(f"DALL-E API error: Status {response.status_code} - {error_msg}")
-        
+                raise ValueError("DALL-E API did not return image data in response")
+        elif response.status_code == 401:
+            raise ValueError("Invalid OpenAI API key. Please check your OPENAI_API_KEY.")
+        elif response.status_code == 429:
+            raise ValueError(
+                "OpenAI API rate limit exceeded. Please wait a moment and try again."
+            )
+        elif response.status_code == 400:
+            # Try to get detailed error from OpenAI API
+            try:
+                error_data = response.json()
+                error_info = error_data.get("error", {})
+                error_msg = error_info.get("message", "Unknown error")
+                error_type = error_info.get("type", "Unknown type")
+                error_code = error_info.get("code", "Unknown code")
+
+                # Log full error for debugging
+                print(f"DALL-E 400 Error Details:")
+                print(f"  Type: {error_type}")
+                print(f"  Code: {error_code}")
+                print(f"  Message: {error_msg}")
+                print(f"  Full response: {error_data}")
+                print(f"  Prompt length: {len(prompt)} characters")
+                print(f"  Prompt preview: {prompt[:100]}...")
+
+                raise ValueError(f"DALL-E API error ({error_type}): {error_msg}")
+            except Exception as parse_error:
+                # If we can't parse JSON, show raw response
+                error_text = response.text if hasattr(response, 'text') else str(response.content[:500])
+                print(f"DALL-E 400 Error (unparseable): {error_text}")
+                raise ValueError(f"DALL-E API error: {error_text}")
+        else:
+            # For other status codes, try to get error message
+            try:
+                error_data = response.json()
+                error_info = error_data.get("error", {})
+                error_msg = error_info.get("message", response.text[:500])
+            except:
+                error_msg = response.text[:500] if hasattr(response, 'text') else str(response.content[:500])
+
+            print(f"DALL-E API Error Status {response.status_code}: {error_msg}")
+            raise ValueError(f"DALL-E API error: Status {response.status_code} - {error_msg}")
+
         image_id = f"dalle_{hash(prompt) % 1000000}"
         
         return ReferenceImage(
@@ -515,130 +516,130 @@ async def _generate_with_nano_banana_pro(
         print(f"  Reference images: {len(payload['input'].get('image_input', []))}")
         print(f"  Prompt: {prompt[:200]}...")
         
-        async with httpx.AsyncClient() as client:
-            # Step 1: Create the generation task
-            response = await client.post(
-                kie_api_url,
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,  # Initial request timeout
-            )
+        client = get_http_client()
+        # Step 1: Create the generation task
+        response = await client.post(
+            kie_api_url,
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,  # Initial request timeout
+        )
             
-            print(f"Response status: {response.status_code}")
-            print(f"Response content-type: {response.headers.get('content-type', 'unknown')}")
+        print(f"Response status: {response.status_code}")
+        print(f"Response content-type: {response.headers.get('content-type', 'unknown')}")
             
-            if response.status_code == 400:
-                # Handle 400 Bad Request - usually means invalid parameters
-                error_text = response.text
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("msg") or error_data.get("message") or str(error_data)
-                    print(f"Kie.ai 400 Error Details: {error_msg}")
-                    raise ValueError(f"Kie.ai API rejected the request: {error_msg}. If you're using reference images, ensure they are publicly accessible URLs (not base64). Save images to Style Guide first to get URLs.")
-                except:
-                    print(f"Kie.ai 400 Error (unparseable): {error_text}")
-                    raise ValueError(f"Kie.ai API rejected the request (400 Bad Request). This may happen if reference images are provided as base64 instead of URLs. Error: {error_text[:200]}")
+        if response.status_code == 400:
+            # Handle 400 Bad Request - usually means invalid parameters
+            error_text = response.text
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("msg") or error_data.get("message") or str(error_data)
+                print(f"Kie.ai 400 Error Details: {error_msg}")
+                raise ValueError(f"Kie.ai API rejected the request: {error_msg}. If you're using reference images, ensure they are publicly accessible URLs (not base64). Save images to Style Guide first to get URLs.")
+            except:
+                print(f"Kie.ai 400 Error (unparseable): {error_text}")
+                raise ValueError(f"Kie.ai API rejected the request (400 Bad Request). This may happen if reference images are provided as base64 instead of URLs. Error: {error_text[:200]}")
             
-            if response.status_code == 200:
-                task_data = response.json()
-                print(f"Full createTask response: {task_data}")
+        if response.status_code == 200:
+            task_data = response.json()
+            print(f"Full createTask response: {task_data}")
                 
-                if task_data.get("code") != 200:
-                    raise ValueError(f"Kie.ai API error: {task_data.get('msg', 'Unknown error')}")
+            if task_data.get("code") != 200:
+                raise ValueError(f"Kie.ai API error: {task_data.get('msg', 'Unknown error')}")
                 
-                # Parse response according to Kie.ai API structure
-                result_data = task_data.get("data", {})
+            # Parse response according to Kie.ai API structure
+            result_data = task_data.get("data", {})
                 
-                # Check if task is already completed synchronously
-                state = result_data.get("state")
+            # Check if task is already completed synchronously
+            state = result_data.get("state")
                 
-                if state == "success":
-                    # Task completed synchronously - extract result URLs from resultJson
-                    image_base64 = await _extract_image_from_result(result_data, client)
-                elif state == "fail":
-                    # Task failed synchronously
-                    fail_msg = result_data.get("failMsg") or result_data.get("fail_msg") or "Task failed"
-                    fail_code = result_data.get("failCode") or result_data.get("fail_code") or "Unknown"
-                    raise ValueError(f"Image generation failed ({fail_code}): {fail_msg}")
-                else:
-                    # Asynchronous - we have a taskId (or recordId)
-                    task_id = result_data.get("taskId") or result_data.get("recordId")
-                    record_id = result_data.get("recordId")  # Save recordId separately
-                    if not task_id:
-                        raise ValueError("Kie.ai API did not return a taskId/recordId and no result found in response")
+            if state == "success":
+                # Task completed synchronously - extract result URLs from resultJson
+                image_base64 = await _extract_image_from_result(result_data, client)
+            elif state == "fail":
+                # Task failed synchronously
+                fail_msg = result_data.get("failMsg") or result_data.get("fail_msg") or "Task failed"
+                fail_code = result_data.get("failCode") or result_data.get("fail_code") or "Unknown"
+                raise ValueError(f"Image generation failed ({fail_code}): {fail_msg}")
+            else:
+                # Asynchronous - we have a taskId (or recordId)
+                task_id = result_data.get("taskId") or result_data.get("recordId")
+                record_id = result_data.get("recordId")  # Save recordId separately
+                if not task_id:
+                    raise ValueError("Kie.ai API did not return a taskId/recordId and no result found in response")
                     
-                    print(f"Task created: {task_id} (taskId: {result_data.get('taskId')}, recordId: {record_id})")
+                print(f"Task created: {task_id} (taskId: {result_data.get('taskId')}, recordId: {record_id})")
                     
-                    if use_callback:
-                        # Use callback mechanism (recommended for production - Railway is publicly accessible)
-                        print(f"Waiting for callback at {callback_url}...")
-                        print(f"  Callbacks should arrive immediately when task completes (per Kie.ai docs)")
+                if use_callback:
+                    # Use callback mechanism (recommended for production - Railway is publicly accessible)
+                    print(f"Waiting for callback at {callback_url}...")
+                    print(f"  Callbacks should arrive immediately when task completes (per Kie.ai docs)")
                         
-                        # Create task tracker and wait for callback
-                        task_result = task_manager.create_task(task_id)
+                    # Create task tracker and wait for callback
+                    task_result = task_manager.create_task(task_id)
                         
-                        # Wait for callback (with reasonable timeout, then fallback to polling)
-                        # Per Kie.ai docs: callbacks arrive immediately when tasks complete
-                        # For Railway/production: callbacks should work, but keep timeout as safety net
-                        # Image generation can take 1-3 minutes, so give callbacks plenty of time
-                        callback_timeout = 180  # 3 minutes - callbacks arrive immediately when done, this is max wait
-                        try:
-                            # Wait for callback to complete the task
-                            print(f"  Waiting up to {callback_timeout}s for callback...")
-                            callback_result_data = await task_result.wait(timeout=callback_timeout)
-                            image_base64 = callback_result_data
-                            print(f"  ✓ Received callback for task {task_id} (callback worked!)")
-                        except TimeoutError:
-                            print(f"  ⚠ Callback not received after {callback_timeout}s")
-                            print(f"  This might indicate:")
-                            print(f"    - Callback URL not accessible from Kie.ai servers")
-                            print(f"    - Network/firewall issues")
-                            print(f"    - Task taking longer than expected")
-                            print(f"  Falling back to polling (reliable fallback)...")
-                            # Fall through to polling
-                            use_callback = False  # Switch to polling mode
+                    # Wait for callback (with reasonable timeout, then fallback to polling)
+                    # Per Kie.ai docs: callbacks arrive immediately when tasks complete
+                    # For Railway/production: callbacks should work, but keep timeout as safety net
+                    # Image generation can take 1-3 minutes, so give callbacks plenty of time
+                    callback_timeout = 180  # 3 minutes - callbacks arrive immediately when done, this is max wait
+                    try:
+                        # Wait for callback to complete the task
+                        print(f"  Waiting up to {callback_timeout}s for callback...")
+                        callback_result_data = await task_result.wait(timeout=callback_timeout)
+                        image_base64 = callback_result_data
+                        print(f"  ✓ Received callback for task {task_id} (callback worked!)")
+                    except TimeoutError:
+                        print(f"  ⚠ Callback not received after {callback_timeout}s")
+                        print(f"  This might indicate:")
+                        print(f"    - Callback URL not accessible from Kie.ai servers")
+                        print(f"    - Network/firewall issues")
+                        print(f"    - Task taking longer than expected")
+                        print(f"  Falling back to polling (reliable fallback)...")
+                        # Fall through to polling
+                        use_callback = False  # Switch to polling mode
                     
-                    if not use_callback:
-                        # Use polling mechanism (fallback or primary if localhost)
-                        print(f"Polling for results...")
-                        try:
-                            # Pass recordId if available (createTask returns both taskId and recordId)
-                            image_base64 = await _poll_for_task_completion(
-                                task_id, api_key, client, max_polls=60, poll_interval=5, record_id=record_id
-                            )
-                        except ValueError as e:
-                            # Log detailed error before re-raising
-                            print(f"ERROR: Polling failed with ValueError: {e}")
-                            print(f"  Task ID: {task_id}")
-                            raise e
-                        except Exception as e:
-                            # Log detailed error before re-raising
-                            print(f"ERROR: Polling failed with Exception: {e}")
-                            print(f"  Task ID: {task_id}")
-                            import traceback
-                            print(f"  Traceback: {traceback.format_exc()}")
-                            raise e
+                if not use_callback:
+                    # Use polling mechanism (fallback or primary if localhost)
+                    print(f"Polling for results...")
+                    try:
+                        # Pass recordId if available (createTask returns both taskId and recordId)
+                        image_base64 = await _poll_for_task_completion(
+                            task_id, api_key, client, max_polls=60, poll_interval=5, record_id=record_id
+                        )
+                    except ValueError as e:
+                        # Log detailed error before re-raising
+                        print(f"ERROR: Polling failed with ValueError: {e}")
+                        print(f"  Task ID: {task_id}")
+                        raise e
+                    except Exception as e:
+                        # Log detailed error before re-raising
+                        print(f"ERROR: Polling failed with Exception: {e}")
+                        print(f"  Task ID: {task_id}")
+                        import traceback
+                        print(f"  Traceback: {traceback.format_exc()}")
+                        raise e
                     
-            elif response.status_code == 401:
-                raise ValueError("Invalid Kie.ai API key. Please check your KIE_AI_API_KEY.")
-            elif response.status_code == 402:
-                raise ValueError("Insufficient credits in your Kie.ai account.")
-            elif response.status_code == 429:
-                raise ValueError(
-                    "Kie.ai API rate limit exceeded. Please wait a moment and try again."
-                )
-            else:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("msg") or error_data.get("message") or response.text[:500]
-                except:
-                    error_msg = response.text[:500] if hasattr(response, 'text') else str(response.content[:500])
+        elif response.status_code == 401:
+            raise ValueError("Invalid Kie.ai API key. Please check your KIE_AI_API_KEY.")
+        elif response.status_code == 402:
+            raise ValueError("Insufficient credits in your Kie.ai account.")
+        elif response.status_code == 429:
+            raise ValueError(
+                "Kie.ai API rate limit exceeded. Please wait a moment and try again."
+            )
+        else:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("msg") or error_data.get("message") or response.text[:500]
+            except:
+                error_msg = response.text[:500] if hasattr(response, 'text') else str(response.content[:500])
                 
-                print(f"Kie.ai API Error Status {response.status_code}: {error_msg}")
-                raise ValueError(f"Kie.ai Nano Banana Pro API error: Status {response.status_code} - {error_msg}")
+            print(f"Kie.ai API Error Status {response.status_code}: {error_msg}")
+            raise ValueError(f"Kie.ai Nano Banana Pro API error: Status {response.status_code} - {error_msg}")
         
         # Ensure we have an image before returning
         if 'image_base64' not in locals():
@@ -929,19 +930,19 @@ async def handle_kie_callback(
             result_url = result_urls[0]
             print(f"Callback: Task {task_id} completed. Downloading image from {result_url[:100]}...")
             
-            async with httpx.AsyncClient() as client:
-                image_response = await client.get(result_url, timeout=30.0)
-                if image_response.status_code == 200:
-                    image_bytes = image_response.content
-                    image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                    image_base64 = f"data:image/png;base64,{image_base64}"
-                    print(f"Callback: Successfully downloaded image for task {task_id}")
-                    task_manager.complete_task(task_id, image_base64)
-                else:
-                    task_manager.fail_task(
-                        task_id,
-                        ValueError(f"Failed to download image: HTTP {image_response.status_code}")
-                    )
+            client = get_http_client()
+            image_response = await client.get(result_url, timeout=30.0)
+            if image_response.status_code == 200:
+                image_bytes = image_response.content
+                image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+                image_base64 = f"data:image/png;base64,{image_base64}"
+                print(f"Callback: Successfully downloaded image for task {task_id}")
+                task_manager.complete_task(task_id, image_base64)
+            else:
+                task_manager.fail_task(
+                    task_id,
+                    ValueError(f"Failed to download image: HTTP {image_response.status_code}")
+                )
         except json.JSONDecodeError as e:
             task_manager.fail_task(task_id, ValueError(f"Failed to parse resultJson: {e}"))
         except Exception as e:
@@ -2,13 +2,48 @@
 Service for analyzing visual style from reference images using OpenAI GPT-4 Vision API.
 """
 
+import hashlib
 import json
 import os
-import base64
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any
-import httpx
 from openai import OpenAI
 
+from app.utils import split_data_uri
+
+
+@lru_cache(maxsize=1)
+def _get_openai_client() -> OpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+
+    The client owns an HTTP connection pool, so building one per analysis
+    call threw away keep-alive connections and re-read the environment.
+
+    Raises:
+        ValueError: If the API key is not configured
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "OPENAI_API_KEY environment variable not set. "
+            "Please set your OpenAI API key in the .env file."
+        )
+    return OpenAI(api_key=api_key)
+
+# In-process memoization of analysis results keyed by image content hash.
+# Users frequently re-submit the same style references, and each miss costs
+# a multi-second GPT-4 Vision call. Bounded LRU so memory stays small.
+_STYLE_CACHE_MAX_ENTRIES = 32
+_style_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _style_cache_key(images: List[str]) -> str:
+    """Build a cache key from the hashes of the analyzed images (order-insensitive)."""
+    digests = sorted(hashlib.sha256(img.encode("utf-8")).digest() for img in images)
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
 
 def analyze_style_from_images(images: List[str]) -> Dict[str, Any]:
     """
@@ -41,17 +76,18 @@ def analyze_style_from_images(images: List[str]) -> Dict[str, Any]:
     """
     if not images:
         raise ValueError("At least one image is required for style analysis")
-    
-    # Get OpenAI API key
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "OPENAI_API_KEY environment variable not set. "
-            "Please set your OpenAI API key in the .env file."
-        )
-    
-    client = OpenAI(api_key=api_key)
-    
+
+    # Serve repeated submissions of the same reference images from cache
+    # instead of re-running the Vision API call
+    cache_key = _style_cache_key(images)
+    cached = _style_cache.get(cache_key)
+    if cached is not None:
+        _style_cache.move_to_end(cache_key)
+        print("Style analysis cache hit - skipping Vision API call")
+        return dict(cached)
+
+    client = _get_openai_client()
+
     # Limit to first 5 images to avoid token limits and improve reliability
     # Large base64 images can exceed token limits
     images_to_analyze = images[:5] if len(images) > 5 else images
@@ -61,23 +97,8 @@ def analyze_style_from_images(images: List[str]) -> Dict[str, Any]:
     # Prepare image content for OpenAI Vision API
     image_contents = []
     for img_data_uri in images_to_analyze:
-        mime_type = "image/png"  # Default
-        
-        # Handle data URI format: data:image/png;base64,<base64_data>
-        if img_data_uri.startswith("data:"):
-            # Extract mime type and base64 data
-            parts = img_data_uri.split(",", 1)
-            header = parts[0]  # data:image/png;base64
-            base64_data = parts[1]
-            
-            # Extract mime type from header
-            if "image/" in header:
-                mime_part = header.split("image/")[1].split(";")[0]
-                mime_type = f"image/{mime_part}"
-        else:
-            # Assume it's already base64
-            base64_data = img_data_uri
-        
+        mime_type, base64_data = split_data_uri(img_data_uri)
+
         # OpenAI Vision API expects image_url format with base64
         image_contents.append({
             "type": "image_url",
@@ -171,9 +192,13 @@ Be thorough and specific. Extract every visual detail that would help recreate t
             "referenceFilms": style_data.get("referenceFilms", ""),
             "additionalNotes": style_data.get("additionalNotes", ""),
         }
-        
+
+        _style_cache[cache_key] = dict(result)
+        if len(_style_cache) > _STYLE_CACHE_MAX_ENTRIES:
+            _style_cache.popitem(last=False)
+
         return result
-        
+
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from OpenAI response: {e}. Response was: {response_text[:500] if response_text else 'No response'}")
     except Exception as e:
@@ -6,6 +6,7 @@ import os
 import httpx
 from typing import Optional, Dict, Any
 from app.models.workflow import AudioAsset
+from app.services.http_client import get_http_client
 
 
 def _get_kie_api_key() -> str:
@@ -84,29 +85,30 @@ async def generate_music_via_api(
         if len(lyrics) > 500:
             payload["prompt"] = lyrics[:500]
     
-    # Make API request
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            "https://api.kie.ai/api/v1/generate",
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-        )
-        
-        if response.status_code != 200:
-            error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
-            error_msg = error_data.get("msg", f"HTTP {response.status_code}")
-            raise Exception(f"Suno API error: {error_msg} (code: {response.status_code})")
-        
-        result = response.json()
-        
-        if result.get("code") != 200:
-            error_msg = result.get("msg", "Unknown error")
-            raise Exception(f"Suno API error: {error_msg} (code: {result.get('code')})")
-        
-        return result.get("data", {})
+    # Make API request on the shared pooled client
+    client = get_http_client()
+    response = await client.post(
+        "https://api.kie.ai/api/v1/generate",
+        json=payload,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+    )
+
+    if response.status_code != 200:
+        error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+        error_msg = error_data.get("msg", f"HTTP {response.status_code}")
+        raise Exception(f"Suno API error: {error_msg} (code: {response.status_code})")
+
+    result = response.json()
+
+    if result.get("code") != 200:
+        error_msg = result.get("msg", "Unknown error")
+        raise Exception(f"Suno API error: {error_msg} (code: {result.get('code')})")
+
+    return result.get("data", {})
 
 
 async def get_music_details(task_id: str) -> Dict[str, Any]:
@@ -121,42 +123,43 @@ async def get_music_details(task_id: str) -> Dict[str, Any]:
         Returns None if task not found (404) - task may still be processing
     """
     api_key = _get_kie_api_key()
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Try the task endpoint - note: Kie.ai may not have a polling endpoint
-        # The callback is the primary mechanism for getting results
-        try:
-            response = await client.get(
-                f"https://api.kie.ai/api/v1/task/{task_id}",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                },
-            )
-        except httpx.RequestError as e:
-            raise Exception(f"Failed to connect to Kie.ai API: {str(e)}")
-        
-        # Handle 404 - task might not exist yet or endpoint doesn't exist
-        if response.status_code == 404:
-            # Task not found - might still be processing or endpoint doesn't exist
-            # Return a status indicating we should wait for callback
-            return {
-                "status": "processing",
-                "message": "Task not found - may still be processing. Waiting for callback.",
-                "task_id": task_id
-            }
-        
-        if response.status_code != 200:
-            error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
-            error_msg = error_data.get("msg", f"HTTP {response.status_code}")
-            raise Exception(f"Suno API error: {error_msg} (code: {response.status_code})")
-        
-        result = response.json()
-        
-        if result.get("code") != 200:
-            error_msg = result.get("msg", "Unknown error")
-            raise Exception(f"Suno API error: {error_msg} (code: {result.get('code')})")
-        
-        return result.get("data", {})
+
+    client = get_http_client()
+    # Try the task endpoint - note: Kie.ai may not have a polling endpoint
+    # The callback is the primary mechanism for getting results
+    try:
+        response = await client.get(
+            f"https://api.kie.ai/api/v1/task/{task_id}",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+            },
+            timeout=30.0,
+        )
+    except httpx.RequestError as e:
+        raise Exception(f"Failed to connect to Kie.ai API: {str(e)}")
+
+    # Handle 404 - task might not exist yet or endpoint doesn't exist
+    if response.status_code == 404:
+        # Task not found - might still be processing or endpoint doesn't exist
+        # Return a status indicating we should wait for callback
+        return {
+            "status": "processing",
+            "message": "Task not found - may still be processing. Waiting for callback.",
+            "task_id": task_id
+        }
+
+    if response.status_code != 200:
+        error_data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+        error_msg = error_data.get("msg", f"HTTP {response.status_code}")
+        raise Exception(f"Suno API error: {error_msg} (code: {response.status_code})")
+
+    result = response.json()
+
+    if result.get("code") != 200:
+        error_msg = result.get("msg", "Unknown error")
+        raise Exception(f"Suno API error: {error_msg} (code: {result.get('code')})")
+
+    return result.get("data", {})
 
 
 def convert_suno_result_to_audio_asset(
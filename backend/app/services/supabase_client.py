@@ -0,0 +1,51 @@
+"""
+Shared Supabase client.
+
+Building a client per request re-reads env vars and re-creates the
+underlying postgrest HTTP session (TCP + TLS handshake) every time, and
+risks exhausting Supabase's connection limit under load. All services and
+routers should resolve the client through get_supabase() instead.
+"""
+
+import os
+from functools import lru_cache
+
+from supabase import create_client, Client
+
+# Credentials resolved once at import time (app.main loads the .env files
+# before importing anything that pulls this module in)
+SUPABASE_URL = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
+
+
+@lru_cache(maxsize=1)
+def get_supabase() -> Client:
+    """
+    Return the process-wide Supabase client, creating it on first use.
+
+    Returns:
+        Client: Shared Supabase client (connection pool is reused across requests)
+
+    Raises:
+        ValueError: If Supabase credentials are not configured
+    """
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        raise ValueError(
+            "Supabase not configured. Please set SUPABASE_URL (or NEXT_PUBLIC_SUPABASE_URL) "
+            "and SUPABASE_ANON_KEY (or NEXT_PUBLIC_SUPABASE_ANON_KEY)"
+        )
+
+    return create_client(SUPABASE_URL, SUPABASE_KEY)
+
+
+def warm_supabase_client() -> bool:
+    """
+    Build the shared client at startup so the first request doesn't pay the cost.
+
+    Returns:
+        bool: True if the client was created, False if Supabase is not configured
+    """
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        return False
+    get_supabase()
+    return True
@@ -4,9 +4,9 @@ Organizes images by workflow/project in storage buckets.
 """
 
 import os
-import base64
 from typing import Optional
 from supabase import create_client, Client
+from app.utils import decode_data_uri
 
 
 def _get_supabase_client() -> Client:
@@ -59,29 +59,50 @@ async def upload_image_to_storage(
         ValueError: If image data is invalid
         Exception: If upload fails
     """
+    # Decode straight from the data URI with the shared (SIMD-accelerated
+    # when available) helper - no intermediate payload string
+    try:
+        content_type, image_bytes = decode_data_uri(image_data_base64)
+    except Exception as e:
+        raise ValueError(f"Invalid base64 image data: {str(e)}")
+
+    return await upload_image_bytes_to_storage(
+        image_bytes, content_type, image_id, workflow_id, description
+    )
+
+
+async def upload_image_bytes_to_storage(
+    image_bytes: bytes,
+    content_type: str,
+    image_id: str,
+    workflow_id: str,
+    description: str
+) -> str:
+    """
+    Upload raw image bytes to Supabase Storage in the workflow's folder.
+
+    Preferred over upload_image_to_storage for clients that can send binary
+    data directly (multipart uploads), since it skips the base64 decode pass.
+
+    Args:
+        image_bytes: Raw image data
+        content_type: MIME type of the image (e.g., "image/png")
+        image_id: Unique identifier for the image
+        workflow_id: Workflow/project identifier
+        description: Description of the image (for metadata)
+
+    Returns:
+        str: Public URL of the uploaded image
+
+    Raises:
+        Exception: If upload fails
+    """
     try:
         supabase = _get_supabase_client()
-        
-        # Extract base64 data from data URI if present
-        if image_data_base64.startswith("data:image"):
-            # Remove data URI prefix (e.g., "data:image/png;base64,")
-            header, base64_data = image_data_base64.split(",", 1)
-            # Extract content type from header
-            content_type = header.split(";")[0].split(":")[1]
-        else:
-            # Assume it's already pure base64
-            base64_data = image_data_base64
-            content_type = "image/png"  # Default to PNG
-        
-        # Decode base64 to bytes
-        try:
-            image_bytes = base64.b64decode(base64_data)
-        except Exception as e:
-            raise ValueError(f"Invalid base64 image data: {str(e)}")
-        
+
         # Create file path: workflow_id/image_id.png
         file_path = f"{workflow_id}/{image_id}.png"
-        
+
         # Upload to Supabase Storage
         # Note: We use the 'reference-images' bucket
         # The bucket should be created in Supabase dashboard with public access
@@ -93,14 +114,14 @@ async def upload_image_to_storage(
                 "upsert": True  # Overwrite if exists
             }
         )
-        
+
         # Get public URL
         # Supabase storage public URLs follow this pattern:
         # {SUPABASE_URL}/storage/v1/object/public/{bucket}/{path}
         public_url = supabase.storage.from_(REFERENCE_IMAGES_BUCKET).get_public_url(file_path)
-        
+
         return public_url
-        
+
     except ValueError:
         raise
     except Exception as e:
@@ -8,6 +8,7 @@ import jwt
 import httpx
 from typing import List, Optional
 from app.models.workflow import VideoClip, FinalVideoPrompt, ReferenceImage
+from app.services.http_client import get_http_client
 
 
 def _generate_kling_jwt_token(access_key: str, secret_key: str) -> str:
@@ -139,40 +140,42 @@ async def generate_video_clip(
         "Content-Type": "application/json",
     }
     
-    async with httpx.AsyncClient() as client:
-        try:
-            # Note: Actual endpoint may vary - adjust based on API documentation
-            endpoint = "/v1/video/generate" if use_kling else "/v1/generate"
-            response = await client.post(
-                f"{api_url}{endpoint}",
-                json=payload,
-                headers=headers,
-                timeout=300.0,  # Video generation can take time
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract video URL and metadata
-            # Note: Adjust field names based on actual API response
-            clip_url = data.get("video_url") or data.get("url")
-            duration = data.get("duration", prompt.duration_seconds)
-            
-            if not clip_url:
-                raise ValueError("Video API did not return video URL")
-            
-            return VideoClip(
-                shot_index=prompt.shot_index,
-                clip_url=clip_url,
-                duration_seconds=duration,
-                final_prompt=prompt.final_prompt,
-            )
-            
-        except httpx.HTTPStatusError as e:
-            raise Exception(
-                f"Video API HTTP error: {e.response.status_code} - {e.response.text}"
-            )
-        except Exception as e:
-            raise Exception(f"Video API error: {e}")
+    # Shared pooled client - a fresh AsyncClient per clip would pay the
+    # TCP + TLS handshake on every generation call
+    client = get_http_client()
+    try:
+        # Note: Actual endpoint may vary - adjust based on API documentation
+        endpoint = "/v1/video/generate" if use_kling else "/v1/generate"
+        response = await client.post(
+            f"{api_url}{endpoint}",
+            json=payload,
+            headers=headers,
+            timeout=300.0,  # Video generation can take time
+        )
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Extract video URL and metadata
+        # Note: Adjust field names based on actual API response
+        clip_url = data.get("video_url") or data.get("url")
+        duration = data.get("duration", prompt.duration_seconds)
+
+        if not clip_url:
+            raise ValueError("Video API did not return video URL")
+
+        return VideoClip(
+            shot_index=prompt.shot_index,
+            clip_url=clip_url,
+            duration_seconds=duration,
+            final_prompt=prompt.final_prompt,
+        )
+
+    except httpx.HTTPStatusError as e:
+        raise Exception(
+            f"Video API HTTP error: {e.response.status_code} - {e.response.text}"
+        )
+    except Exception as e:
+        raise Exception(f"Video API error: {e}")
 
 
@@ -4,4 +4,4 @@
 
 PORT=${PORT:-8000}
 echo "Starting uvicorn on port $PORT"
-uvicorn app.main:app --host 0.0.0.0 --port $PORT
+uvicorn app.main:app --host 0.0.0.0 --port $PORT --loop uvloop --http httptools
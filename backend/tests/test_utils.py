@@ -0,0 +1,42 @@
+"""
+Unit tests for shared base64/data URI helpers.
+"""
+
+import base64
+
+from app.utils import b64decode_image, decode_data_uri, split_data_uri
+
+
+def test_split_data_uri_with_prefix():
+    """Test splitting a full data URI."""
+    mime_type, data = split_data_uri("data:image/jpeg;base64,aGVsbG8=")
+    assert mime_type == "image/jpeg"
+    assert data == "aGVsbG8="
+
+
+def test_split_data_uri_plain_base64():
+    """Test that plain base64 falls back to the PNG mime type."""
+    mime_type, data = split_data_uri("aGVsbG8=")
+    assert mime_type == "image/png"
+    assert data == "aGVsbG8="
+
+
+def test_decode_data_uri_with_prefix():
+    """Test single-pass decoding of a full data URI."""
+    mime_type, data = decode_data_uri("data:image/jpeg;base64,aGVsbG8=")
+    assert mime_type == "image/jpeg"
+    assert data == b"hello"
+
+
+def test_decode_data_uri_plain_base64():
+    """Test that plain base64 falls back to the PNG mime type."""
+    mime_type, data = decode_data_uri("aGVsbG8=")
+    assert mime_type == "image/png"
+    assert data == b"hello"
+
+
+def test_b64decode_image_roundtrip():
+    """Test decoding matches the stdlib."""
+    payload = b"test image bytes"
+    encoded = base64.b64encode(payload).decode("ascii")
+    assert b64decode_image(encoded) == payload
@@ -54,7 +54,7 @@ fi
 
 # Start backend in background
 echo "🚀 Starting FastAPI backend on http://localhost:8000"
-uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 &
+uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools &
 BACKEND_PID=$!
 
 cd ..
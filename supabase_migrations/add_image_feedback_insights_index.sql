@@ -0,0 +1,5 @@
+-- Composite index matching the learning-insights query shape:
+-- filter on channel_name/content_type + approved, order by created_at DESC.
+CREATE INDEX IF NOT EXISTS idx_image_feedback_insights
+  ON image_feedback (channel_name, content_type, created_at DESC)
+  WHERE approved = TRUE OR favorited = TRUE;
@@ -0,0 +1,4 @@
+-- Functional index backing the Suno callback lookup:
+-- video_workflows filtered on audio_asset->>'file_url' = 'task://{task_id}'.
+CREATE INDEX IF NOT EXISTS ix_workflow_audio_task
+  ON video_workflows ((audio_asset->>'file_url'));
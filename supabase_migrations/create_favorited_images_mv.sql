@@ -0,0 +1,33 @@
+-- Denormalized materialized view for /api/learning/favorited-images.
+--
+-- Precomputes the image_feedback x video_workflows join (including the
+-- jsonb_array_elements extraction) so the endpoint can be served by a single
+-- indexed SELECT instead of joining at request time. Complements the
+-- get_favorited_reference_images RPC, which can be repointed at this view
+-- once it is refreshed on a schedule.
+CREATE MATERIALIZED VIEW IF NOT EXISTS favorited_images_mv AS
+SELECT
+  f.image_id,
+  f.workflow_id,
+  f.description,
+  f.visual_characteristics,
+  ri->>'base64_data' AS base64_data,
+  ri->>'storage_url' AS storage_url,
+  f.created_at
+FROM image_feedback f
+JOIN video_workflows w ON w.workflow_id = f.workflow_id,
+     LATERAL jsonb_array_elements(w.reference_images) ri
+WHERE f.favorited = TRUE
+  AND ri->>'image_id' = f.image_id;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_favorited_images_mv_image_id
+  ON favorited_images_mv (image_id);
+
+-- Covering index for the endpoint's ORDER BY created_at DESC LIMIT n
+CREATE INDEX IF NOT EXISTS idx_favorited_images_mv_created_at
+  ON favorited_images_mv (created_at DESC);
+
+-- Refresh without blocking readers; run on an interval (e.g. pg_cron) or
+-- after feedback writes:
+--   REFRESH MATERIALIZED VIEW CONCURRENTLY favorited_images_mv;
@@ -0,0 +1,33 @@
+-- RPC to serve /api/learning/favorited-images with a single server-side query.
+--
+-- The API previously fetched each workflow's entire reference_images JSONB
+-- array (potentially hundreds of base64 images) just to pick out one entry
+-- per favorite in Python. This function does the join and element extraction
+-- in Postgres so only the matching entries cross the wire.
+CREATE OR REPLACE FUNCTION get_favorited_reference_images(p_limit integer DEFAULT 50)
+RETURNS TABLE (
+  image_id TEXT,
+  workflow_id TEXT,
+  description TEXT,
+  visual_characteristics JSONB,
+  base64_data TEXT,
+  storage_url TEXT,
+  created_at TIMESTAMPTZ
+)
+LANGUAGE sql STABLE AS $$
+  SELECT
+    f.image_id,
+    f.workflow_id,
+    f.description,
+    f.visual_characteristics,
+    ri->>'base64_data' AS base64_data,
+    ri->>'storage_url' AS storage_url,
+    f.created_at
+  FROM image_feedback f
+  JOIN video_workflows w ON w.workflow_id = f.workflow_id,
+       LATERAL jsonb_array_elements(w.reference_images) ri
+  WHERE f.favorited = TRUE
+    AND ri->>'image_id' = f.image_id
+  ORDER BY f.created_at DESC
+  LIMIT p_limit;
+$$;